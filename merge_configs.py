@@ -1,9 +1,33 @@
+import os
+import sys
+import pickle
+import hashlib
 import logging
+import yaml as pyyaml
+from concurrent.futures import ThreadPoolExecutor
 from ruamel.yaml import YAML
 from src.open_llm_vtuber.config_manager.utils import load_text_file_with_guess_encoding
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+    _HAS_LIBYAML = True
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader
+
+    _HAS_LIBYAML = False
+
 logger = logging.getLogger(__name__)
 
+# Sentinel for single-probe dict lookups in the config walkers
+_MISSING = object()
+
+
+def _dotted(path: tuple) -> str:
+    """Join a tuple of keys into an interned dotted config path."""
+    return sys.intern(".".join(map(str, path)))
+
+
 # Multilingual texts for merge_configs log messages
 TEXTS_MERGE = {
     "zh": {
@@ -29,26 +53,75 @@ TEXTS_COMPARE = {
 }
 
 
+def load_yaml_safe(path: str):
+    """Parse a YAML file into plain Python objects, using libyaml when available."""
+    return pyyaml.load(load_text_file_with_guess_encoding(path), Loader=SafeLoader)
+
+
+def _default_cache_key(path: str) -> tuple:
+    """Build a cache key from the file's size, mtime and a hash of its head."""
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        head_digest = hashlib.sha1(f.read(4096)).hexdigest()
+    return (st.st_size, st.st_mtime_ns, head_digest)
+
+
+def _load_default_cached(path: str):
+    """
+    Load a (read-only) default config template, reusing a pickled sidecar
+    cache next to the template when the file has not changed since it was built.
+    """
+    cache_path = path + ".cache.pkl"
+    key = _default_cache_key(path)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == key:
+            return cached_config
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    config = load_yaml_safe(path)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, config), f, protocol=5)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+    return config
+
+
 def merge_configs(user_path: str, default_path: str, lang: str = "en"):
-    yaml = YAML()
+    # Only the user config is written back, so only it needs the round-trip loader
+    yaml = YAML(typ="rt")
     yaml.preserve_quotes = True
 
     user_config = yaml.load(load_text_file_with_guess_encoding(user_path))
-    default_config = yaml.load(load_text_file_with_guess_encoding(default_path))
+    default_config = _load_default_cached(default_path)
 
-    new_keys = []
+    def merge(d_user, d_default, insert):
+        # Iterative walk with an explicit stack of (user, default, path) frames.
+        # Returns the keys of d_default missing from d_user, copying them into
+        # d_user when insert is set.
+        _dict = dict
+        found = []
+        stack = [(d_user, d_default, ())]
+        while stack:
+            du, dd, path = stack.pop()
+            for k, v in dd.items():
+                uv = du.get(k, _MISSING)
+                if uv is _MISSING:
+                    if insert:
+                        du[sys.intern(k) if isinstance(k, str) else k] = v
+                    found.append(_dotted(path + (k,)))
+                elif isinstance(v, _dict) and isinstance(uv, _dict):
+                    stack.append((uv, v, path + (k,)))
+        return found
 
-    def merge(d_user, d_default, path=""):
-        for k, v in d_default.items():
-            current_path = f"{path}.{k}" if path else k
-            if k not in d_user:
-                d_user[k] = v
-                new_keys.append(current_path)
-            elif isinstance(v, dict) and isinstance(d_user.get(k), dict):
-                merge(d_user[k], v, current_path)
-        return d_user
-
-    merged = merge(user_config, default_config)
+    # Find new keys with the fast plain-dict template, without touching the
+    # user config; it is only merged on the write path below
+    new_keys = merge(user_config, default_config, insert=False)
+    merged = user_config
 
     # Update conf_version from default_config without overriding other user settings
     version_value = (
@@ -57,23 +130,31 @@ def merge_configs(user_path: str, default_path: str, lang: str = "en"):
         else ""
     )
     version_change_string = "conf_version: " + version_value
+    version_changed = False
 
     if (
         "system_config" in default_config
         and "conf_version" in default_config["system_config"]
     ):
-        merged.setdefault("system_config", {})
-        merged["system_config"]["conf_version"] = default_config["system_config"][
-            "conf_version"
-        ]
-        version_change_string = (
-            version_change_string
-            + " -> "
-            + default_config["system_config"]["conf_version"]
-        )
-
-    with open(user_path, "w", encoding='utf-8') as f:
-        yaml.dump(merged, f)
+        default_version = default_config["system_config"]["conf_version"]
+        version_changed = version_value != default_version
+        version_change_string = version_change_string + " -> " + default_version
+
+    # The round-trip dump is the most expensive step, skip it when nothing changed
+    if new_keys or version_changed:
+        if new_keys:
+            # Copy new keys from a round-trip load of the template, so they
+            # keep its comments and quoting in the written user config
+            merge(
+                merged,
+                yaml.load(load_text_file_with_guess_encoding(default_path)),
+                insert=True,
+            )
+        if version_changed:
+            merged.setdefault("system_config", {})
+            merged["system_config"]["conf_version"] = default_version
+        with open(user_path, "w", encoding='utf-8') as f:
+            yaml.dump(merged, f)
 
     # Log upgrade details (replacing manual file writing)
     texts = TEXTS_MERGE.get(lang, TEXTS_MERGE["en"])
@@ -83,70 +164,143 @@ def merge_configs(user_path: str, default_path: str, lang: str = "en"):
     return new_keys
 
 
-def collect_all_subkeys(d, base_path):
-    """Collect all keys in the dictionary d, recursively, with base_path as the prefix."""
-    keys = []
-    # Only process if d is a dictionary
-    if isinstance(d, dict):
-        for key, value in d.items():
-            current_path = f"{base_path}.{key}" if base_path else key
-            keys.append(current_path)
+def _collect_subkeys(d, base_path, out):
+    stack = [(d, (base_path,) if base_path else ())]
+    while stack:
+        node, path = stack.pop()
+        for key, value in node.items():
+            current_path = path + (key,)
+            out.append(_dotted(current_path))
             if isinstance(value, dict):
-                keys.extend(collect_all_subkeys(value, current_path))
-    return keys
-
-
-def get_missing_keys(user, default, path=""):
-    """Recursively find keys in default that are missing in user."""
-    missing = []
-    for key, default_val in default.items():
-        current_path = f"{path}.{key}" if path else key
-        if key not in user:
-            missing.append(current_path)
-        else:
-            user_val = user[key]
-            if isinstance(default_val, dict):
-                if isinstance(user_val, dict):
-                    missing.extend(
-                        get_missing_keys(user_val, default_val, current_path)
-                    )
+                stack.append((value, current_path))
+    return out
+
+
+def collect_all_subkeys(d, base_path, memo=None, out=None):
+    """
+    Collect all keys in the dictionary d, recursively, with base_path as the prefix.
+
+    Keys are appended to out (a new list if not given), which is returned.
+    If a memo dict is given, the relative keys of each subtree are cached by
+    the subtree's id, so the memo must not outlive mutations of the walked dicts.
+    """
+    if out is None:
+        out = []
+    # Only process if d is a dictionary
+    if not isinstance(d, dict):
+        return out
+    if memo is None:
+        return _collect_subkeys(d, base_path, out)
+    relative = memo.get(id(d))
+    if relative is None:
+        relative = memo[id(d)] = _collect_subkeys(d, "", [])
+    if not base_path:
+        out.extend(relative)
+    else:
+        out.extend(sys.intern(f"{base_path}.{key}") for key in relative)
+    return out
+
+
+def get_missing_keys(user, default, path="", out=None):
+    """Find keys in default that are missing in user, appending them to out."""
+    _dict = dict
+    memo = {}
+    missing = [] if out is None else out
+    stack = [(user, default, (path,) if path else ())]
+    while stack:
+        user_node, default_node, node_path = stack.pop()
+        for key, default_val in default_node.items():
+            user_val = user_node.get(key, _MISSING)
+            if user_val is _MISSING:
+                missing.append(_dotted(node_path + (key,)))
+                continue
+            if isinstance(default_val, _dict):
+                if isinstance(user_val, _dict):
+                    stack.append((user_val, default_val, node_path + (key,)))
                 else:
-                    subtree_missing = collect_all_subkeys(default_val, current_path)
-                    missing.extend(subtree_missing)
+                    collect_all_subkeys(
+                        default_val, _dotted(node_path + (key,)), memo, missing
+                    )
     return missing
 
 
-def get_extra_keys(user, default, path=""):
-    """Recursively find keys in user that are not present in default."""
-    extra = []
-    for key, user_val in user.items():
-        current_path = f"{path}.{key}" if path else key
-        if key not in default:
-            # Only collect subkeys if the value is a dictionary
-            if isinstance(user_val, dict):
-                subtree_extra = collect_all_subkeys(user_val, current_path)
-                extra.extend(subtree_extra)
-            extra.append(current_path)
-        else:
-            default_val = default[key]
-            if isinstance(user_val, dict) and isinstance(default_val, dict):
-                extra.extend(get_extra_keys(user_val, default_val, current_path))
-            elif isinstance(user_val, dict):
-                subtree_extra = collect_all_subkeys(user_val, current_path)
-                extra.extend(subtree_extra)
+def get_extra_keys(user, default, path="", out=None):
+    """Find keys in user that are not present in default, appending them to out."""
+    _dict = dict
+    memo = {}
+    extra = [] if out is None else out
+    stack = [(user, default, (path,) if path else ())]
+    while stack:
+        user_node, default_node, node_path = stack.pop()
+        for key, user_val in user_node.items():
+            default_val = default_node.get(key, _MISSING)
+            if default_val is _MISSING:
+                current_path = _dotted(node_path + (key,))
+                # Only collect subkeys if the value is a dictionary
+                if isinstance(user_val, _dict):
+                    collect_all_subkeys(user_val, current_path, memo, extra)
+                extra.append(current_path)
+                continue
+            if isinstance(user_val, _dict) and isinstance(default_val, _dict):
+                stack.append((user_val, default_val, node_path + (key,)))
+            elif isinstance(user_val, _dict):
+                collect_all_subkeys(user_val, _dotted(node_path + (key,)), memo, extra)
     return extra
 
 
+def _collect_value_keys(d) -> frozenset:
+    """Collect the dotted paths of the keys in d whose value is not a mapping."""
+    out = []
+    stack = [(d, ())]
+    while stack:
+        node, path = stack.pop()
+        for key, value in node.items():
+            current_path = path + (key,)
+            if isinstance(value, dict):
+                stack.append((value, current_path))
+            else:
+                out.append(_dotted(current_path))
+    return frozenset(out)
+
+
+def _report_missing(key: str, missing_keys: frozenset, user_values: frozenset) -> bool:
+    """
+    Whether a missing key is reported by compare_configs.
+
+    A section missing from a user mapping is reported once, not every key
+    underneath it. Where the user has a scalar or empty value in place of a
+    default mapping, every default key below it is reported.
+    """
+    # Walk up to the outermost missing ancestor of the key
+    top = key
+    parent = key.rpartition(".")[0]
+    while parent in missing_keys:
+        top = parent
+        parent = parent.rpartition(".")[0]
+    return top == key or parent in user_values
+
+
 def compare_configs(user_path: str, default_path: str, lang: str = "en") -> bool:
     """Compare user and default configs, log discrepancies, and return status."""
-    yaml = YAML(typ="safe")
-    yaml.preserve_quotes = True
-
-    user_config = yaml.load(load_text_file_with_guess_encoding(user_path))
-    default_config = yaml.load(load_text_file_with_guess_encoding(default_path))
+    if _HAS_LIBYAML:
+        # Both parses run mostly in libyaml's C code, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            user_future = executor.submit(load_yaml_safe, user_path)
+            default_future = executor.submit(_load_default_cached, default_path)
+            user_config, default_config = user_future.result(), default_future.result()
+    else:
+        user_config = load_yaml_safe(user_path)
+        default_config = _load_default_cached(default_path)
 
-    missing = get_missing_keys(user_config, default_config)
-    extra = get_extra_keys(user_config, default_config)
+    # Flatten each side once into its set of dotted paths and diff the sets
+    user_keys = frozenset(collect_all_subkeys(user_config, ""))
+    default_keys = frozenset(collect_all_subkeys(default_config, ""))
+    missing_keys = default_keys - user_keys
+    user_values = _collect_value_keys(user_config)
+    missing = sorted(
+        key for key in missing_keys if _report_missing(key, missing_keys, user_values)
+    )
+    extra = sorted(user_keys - default_keys)
 
     texts = TEXTS_COMPARE.get(lang, TEXTS_COMPARE["en"])
 
@@ -2,22 +2,47 @@ import os
 import sys
 import atexit
 import argparse
+import importlib.util
+from functools import lru_cache
+from importlib.metadata import version as _pkg_version, PackageNotFoundError
 from pathlib import Path
-import tomli
-import uvicorn
+from typing import TYPE_CHECKING
 from loguru import logger
-from upgrade import sync_user_config, select_language
-from src.open_llm_vtuber.server import WebSocketServer
-from src.open_llm_vtuber.config_manager import Config, read_yaml, validate_config
+
+# Heavy imports (uvicorn, the server, pydantic config models) are deferred to
+# the functions that need them so that e.g. `--help` starts instantly.
+if TYPE_CHECKING:
+    from src.open_llm_vtuber.config_manager import Config
 
 os.environ["HF_HOME"] = str(Path(__file__).parent / "models")
 os.environ["MODELSCOPE_CACHE"] = str(Path(__file__).parent / "models")
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
-    with open("pyproject.toml", "rb") as f:
-        pyproject = tomli.load(f)
-    return pyproject["project"]["version"]
+    try:
+        return _pkg_version("open-llm-vtuber")
+    except PackageNotFoundError:
+        # Not installed as a distribution, fall back to reading pyproject.toml
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open("pyproject.toml", "rb") as f:
+            pyproject = tomllib.load(f)
+        return pyproject["project"]["version"]
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int) -> "Config":
+    from src.open_llm_vtuber.config_manager import read_yaml, validate_config
+
+    return validate_config(read_yaml(config_path))
+
+
+def load_config(config_path: str) -> "Config":
+    """Parse and validate a config file, reusing the result until the file changes."""
+    return _load_config_cached(config_path, os.stat(config_path).st_mtime_ns)
 
 
 def init_logger(console_log_level: str = "INFO") -> None:
@@ -53,6 +78,10 @@ def parse_args():
 
 @logger.catch
 def run(console_log_level: str):
+    import uvicorn
+    from upgrade import sync_user_config, select_language
+    from src.open_llm_vtuber.server import WebSocketServer
+
     init_logger(console_log_level)
     logger.info(f"Open-LLM-VTuber, version v{get_version()}")
     # Sync user config with default config
@@ -64,16 +93,21 @@ def run(console_log_level: str):
     atexit.register(WebSocketServer.clean_cache)
 
     # Load configurations from yaml file
-    config: Config = validate_config(read_yaml("conf.yaml"))
+    config = load_config("conf.yaml")
     server_config = config.system_config
 
     # Initialize and run the WebSocket server
     server = WebSocketServer(config=config)
+    # The conversation paths send many small websocket frames per turn, so
+    # prefer uvloop's libuv event loop; it is not available on Windows
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    logger.debug(f"Using {loop} event loop")
     uvicorn.run(
         app=server.app,
         host=server_config.host,
         port=server_config.port,
         log_level=console_log_level.lower(),
+        loop=loop,
     )
 
 
@@ -49,9 +49,7 @@ class AsyncLLM(StatelessLLMInterface):
                 stream=True,
             )
             async for chunk in stream:
-                if chunk.choices[0].delta.content is None:
-                    chunk.choices[0].delta.content = ""
-                yield chunk.choices[0].delta.content
+                yield chunk.choices[0].delta.content or ""
         except APIConnectionError as e:
             logger.error(
                 "Error calling the chat endpoint: Connection error. %s",
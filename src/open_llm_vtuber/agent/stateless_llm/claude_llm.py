@@ -40,20 +40,25 @@ class AsyncLLM(StatelessLLMInterface):
 
     def _convert_message_format(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Convert message format to Claude's expected format."""
-        if "content" not in message or not isinstance(message["content"], list):
+        content = message.get("content")
+        if not isinstance(content, list):
             return message
 
-        print("message", message)
+        # Text-only messages need no conversion
+        if not any(
+            isinstance(ci, dict) and ci.get("type") == "image_url" for ci in content
+        ):
+            return message
 
         new_content = []
-        for content_item in message["content"]:
+        for content_item in content:
             if content_item.get("type") == "image_url":
                 # Extract media type and base64 data from data URL
                 data_url = content_item["image_url"]["url"]
                 # Split 'data:image/jpeg;base64,/9j/4AAQ...' into parts
                 header, base64_data = data_url.split(",", 1)
                 # Extract media type from 'data:image/jpeg;base64'
-                media_type = header.split(":")[1].split(";")[0]
+                media_type = header.partition(":")[2].partition(";")[0]
 
                 new_content.append(
                     {
@@ -68,7 +73,9 @@ class AsyncLLM(StatelessLLMInterface):
             else:
                 new_content.append(content_item)
 
-        print("new_content", new_content)
+        logger.opt(lazy=True).debug(
+            "Converted {n} content items for Claude", n=lambda: len(new_content)
+        )
         return {"role": message["role"], "content": new_content}
 
     async def chat_completion(
@@ -103,9 +110,7 @@ class AsyncLLM(StatelessLLMInterface):
 
             async for chunk in stream:
                 if chunk.type == "content_block_delta":
-                    if chunk.delta.text is None:
-                        chunk.delta.text = ""
-                    yield chunk.delta.text
+                    yield chunk.delta.text or ""
 
         except Exception as e:
             logger.error(f"Claude API error occurred: {str(e)}")
@@ -13,6 +13,7 @@ class ASRFactory:
                 download_root=kwargs.get("download_root"),
                 language=kwargs.get("language"),
                 device=kwargs.get("device"),
+                compute_type=kwargs.get("compute_type", "auto"),
             )
         elif system_name == "whisper_cpp":
             from .whisper_cpp_asr import VoiceRecognition as WhisperCPPASR
@@ -62,6 +63,7 @@ class ASRFactory:
             return MERaLiONASR(
                 model_path=kwargs.get("model_path"),
                 device=kwargs.get("device"),
+                compile_model=kwargs.get("compile_model", False),
             )
         else:
             raise ValueError(f"Unknown ASR system: {system_name}")
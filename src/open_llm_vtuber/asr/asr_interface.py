@@ -20,9 +20,7 @@ class ASRInterface(metaclass=abc.ABCMeta):
         Returns:
             str: The transcription result.
         """
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
-        return await asyncio.to_thread(self.transcribe_np, audio)
+        return await asyncio.to_thread(self.transcribe_np, self._prep_audio(audio))
 
     @abc.abstractmethod
     def transcribe_np(self, audio: np.ndarray) -> str:
@@ -33,6 +31,24 @@ class ASRInterface(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _prep_audio(audio: np.ndarray) -> np.ndarray:
+        """Return the audio as a contiguous float32 array in [-1, 1].
+
+        Integer PCM is scaled by its dtype's maximum; float32 input that is
+        already contiguous is returned without a copy.
+
+        Args:
+            audio: The numpy array of the audio data.
+        """
+        if audio.dtype == np.float32:
+            return np.ascontiguousarray(audio)
+        if np.issubdtype(audio.dtype, np.integer):
+            scaled = audio.astype(np.float32)
+            scaled *= 1.0 / np.iinfo(audio.dtype).max
+            return scaled
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
     def nparray_to_audio_file(
         self, audio: np.ndarray, sample_rate: int, file_path: str
     ) -> None:
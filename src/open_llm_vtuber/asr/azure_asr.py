@@ -4,11 +4,8 @@ import numpy as np
 from loguru import logger
 import azure.cognitiveservices.speech as speechsdk
 from .asr_interface import ASRInterface
-import soundfile as sf
-import uuid
 import asyncio
-
-CACHE_DIR = "cache"
+from concurrent.futures import ThreadPoolExecutor
 
 
 class VoiceRecognition(ASRInterface):
@@ -43,6 +40,12 @@ class VoiceRecognition(ASRInterface):
             logger.error(f"Failed to initialize Azure Speech Config: {e}")
             raise
 
+        self._stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=self.SAMPLE_RATE,
+            bits_per_sample=self.SAMPLE_WIDTH * 8,
+            channels=self.NUM_CHANNELS,
+        )
+
     def _create_speech_recognizer(self, uses_default_microphone: bool = True):
         """
         Create a speech recognizer instance with the specified configuration.
@@ -64,6 +67,37 @@ class VoiceRecognition(ASRInterface):
             logger.warning(f"Failed to create speech recognizer: {e}")
             raise
 
+    def _recognize_pcm(self, pcm: bytes):
+        """
+        Recognize one utterance of PCM16 audio.
+
+        Each call gets its own push stream, closed after the audio is written
+        so the end of the stream marks the end of the utterance. Only the
+        speech config and stream format are shared between calls.
+        """
+        push_stream = speechsdk.audio.PushAudioInputStream(self._stream_format)
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            audio_config=speechsdk.AudioConfig(stream=push_stream),
+        )
+        push_stream.write(pcm)
+        push_stream.close()
+        return recognizer.recognize_once_async().get()
+
+    @staticmethod
+    def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+        """
+        Convert audio to contiguous 16-bit PCM samples.
+
+        Float input in [-1, 1] is scaled and clipped in float32 with a single
+        cast to int16; int16 input is passed through unchanged.
+        """
+        if audio.dtype == np.int16:
+            return np.ascontiguousarray(audio)
+        pcm = np.multiply(audio, 32767.0, dtype=np.float32)
+        np.clip(pcm, -32768, 32767, out=pcm)
+        return pcm.astype(np.int16)
+
     async def async_transcribe_np(self, audio: np.ndarray) -> str:
         """
         Asynchronously transcribe audio data using Azure Speech Services with auto language detection.
@@ -77,20 +111,13 @@ class VoiceRecognition(ASRInterface):
         Raises:
             Exception: If transcription fails
         """
-        temp_file = os.path.join(CACHE_DIR, f"{uuid.uuid4()}.wav")
-
         try:
-            os.makedirs(CACHE_DIR, exist_ok=True)
-            sf.write(temp_file, audio, 16000, "PCM_16")
-
-            audio_config = speechsdk.AudioConfig(filename=temp_file)
-            speech_recognizer = speechsdk.SpeechRecognizer(
-                speech_config=self.speech_config, audio_config=audio_config
+            # Feed raw PCM16 straight from memory into a push-stream recognizer,
+            # off the event loop since recognition blocks for the whole RPC
+            result = await asyncio.to_thread(
+                self._recognize_pcm, self._to_pcm16(audio).tobytes()
             )
 
-            # Perform recognition
-            result = speech_recognizer.recognize_once()
-
             if result.reason == speechsdk.ResultReason.RecognizedSpeech:
                 # Get detected language
                 detected_language = result.properties.get(
@@ -117,12 +144,6 @@ class VoiceRecognition(ASRInterface):
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
-        finally:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception as e:
-                logger.debug(f"Failed to remove temporary file {temp_file}: {e}")
 
     def transcribe_np(self, audio: np.ndarray) -> str:
         """
@@ -139,13 +160,16 @@ class VoiceRecognition(ASRInterface):
         """
         try:
             try:
-                loop = asyncio.get_event_loop()
+                asyncio.get_running_loop()
             except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Run async method synchronously
-            return loop.run_until_complete(self.async_transcribe_np(audio))
+                # No loop in this thread, run the async method directly
+                return asyncio.run(self.async_transcribe_np(audio))
+
+            # A loop is already running here, so run on a worker thread's own loop
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(
+                    asyncio.run, self.async_transcribe_np(audio)
+                ).result()
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
@@ -1,4 +1,5 @@
 import numpy as np
+import ctranslate2
 from faster_whisper import WhisperModel
 from .asr_interface import ASRInterface
 
@@ -13,6 +14,7 @@ class VoiceRecognition(ASRInterface):
         download_root: str = None,
         language: str = "en",
         device: str = "auto",
+        compute_type: str = "auto",
     ) -> None:
         self.MODEL_PATH = model_path
         self.LANG = language
@@ -21,9 +23,21 @@ class VoiceRecognition(ASRInterface):
             model_path,
             download_root=download_root,
             device=device,
-            compute_type="float32",
+            compute_type=(
+                self._select_compute_type(device)
+                if compute_type == "auto"
+                else compute_type
+            ),
+            num_workers=1,
         )
 
+    @staticmethod
+    def _select_compute_type(device: str) -> str:
+        """Default compute type: int8 GEMMs on CPU, fp16 on CUDA."""
+        if device == "auto":
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        return "float16" if device == "cuda" else "int8"
+
     def transcribe_np(self, audio: np.ndarray) -> str:
         segments, info = self.model.transcribe(
             audio,
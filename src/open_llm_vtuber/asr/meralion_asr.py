@@ -1,60 +1,175 @@
+import asyncio
+import importlib.util
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, List, Tuple
 import numpy as np
 import re
-import torch
-from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor
+from loguru import logger
 
 from .asr_interface import ASRInterface
 
+if TYPE_CHECKING:
+    import torch
+
+PROMPT_TEMPLATE = "Instruction: {query} \nFollow the text instruction based on the following audio: <SpeechHere>"
+TRANSCRIBE_PROMPT = "Please transcribe this speech."
+# How long to wait for concurrent utterances before running a batch
+BATCH_WINDOW_SECONDS = 0.02
+# Prefixes like "Assistant:" (or a bare ":") that the model may generate
+_PREFIX_RE = re.compile(r"^\s*(?:\w+:|:)\s*")
+
 
 class VoiceRecognition(ASRInterface):
     """MERaLiON ASR implementation using Hugging Face models."""
 
-    def __init__(self, model_path: str, device: str = "auto") -> None:
+    def __init__(
+        self, model_path: str, device: str = "auto", compile_model: bool = False
+    ) -> None:
+        # Imported here so selecting another ASR backend never loads torch
+        import torch
+        from transformers import (
+            AutoModelForSpeechSeq2Seq,
+            AutoProcessor,
+            BitsAndBytesConfig,
+        )
+
         if device == "auto":
             device = "cuda" if torch.cuda.is_available() else "cpu"
         self.device = device
         self.processor = AutoProcessor.from_pretrained(
             model_path, trust_remote_code=True
         )
-        self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
-            model_path,
-            use_safetensors=True,
-            trust_remote_code=True,
-            torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
-        ).to(self.device)
+        # INT8 weights via bitsandbytes on CUDA when it is installed;
+        # CPU int8 paths are slower than fp32, so CPU keeps full precision
+        quantize = (
+            self.device == "cuda"
+            and importlib.util.find_spec("bitsandbytes") is not None
+        )
+        self._quantized = quantize
+        if quantize:
+            self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
+                model_path,
+                use_safetensors=True,
+                trust_remote_code=True,
+                quantization_config=BitsAndBytesConfig(
+                    load_in_8bit=True, llm_int8_threshold=6.0
+                ),
+                device_map=self.device,
+            )
+            logger.info("Loaded MERaLiON with int8 weights (bitsandbytes)")
+        else:
+            self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
+                model_path,
+                use_safetensors=True,
+                trust_remote_code=True,
+                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
+            ).to(self.device)
+        if compile_model and self.device == "cuda" and not quantize:
+            # Compile forward (generate calls it per decoding step) so decoding
+            # can be captured with CUDA graphs. Compilation happens lazily and
+            # recompiles for new batch and cache shapes, so the first
+            # transcriptions are slow; opt-in only
+            self.model.forward = torch.compile(
+                self.model.forward, mode="reduce-overhead", fullgraph=False
+            )
+        self._autocast_dtype = self._select_autocast_dtype()
 
-    def transcribe_np(self, audio: np.ndarray) -> str:
-        audio_list = [audio]
-        prompt_template = "Instruction: {query} \nFollow the text instruction based on the following audio: <SpeechHere>"
-        transcribe_prompt = "Please transcribe this speech."
+        # The prompt is constant, so render the chat template only once
         conversation = [
             [
                 {
                     "role": "user",
-                    "content": prompt_template.format(query=transcribe_prompt),
+                    "content": PROMPT_TEMPLATE.format(query=TRANSCRIBE_PROMPT),
                 }
             ]
         ]
-        chat_prompt = self.processor.tokenizer.apply_chat_template(
+        self._chat_prompt = self.processor.tokenizer.apply_chat_template(
             conversation=conversation, tokenize=False, add_generation_prompt=True
         )
-        inputs = self.processor(text=chat_prompt, audios=audio_list)
+
+        # Utterances waiting for the next micro-batch
+        self._pending: List[Tuple[np.ndarray, asyncio.Future]] = []
+        self._batch_task: asyncio.Task | None = None
+
+    def transcribe_np_batch(self, audios: List[np.ndarray]) -> List[str]:
+        """Transcribe several utterances with a single padded generate call."""
+        import torch
+
+        audios = [self._prep_audio(audio) for audio in audios]
+        inputs = self.processor(
+            text=[self._chat_prompt] * len(audios), audios=audios, padding=True
+        )
         for key, value in inputs.items():
             if isinstance(value, torch.Tensor):
                 inputs[key] = value.to(self.device)
-                if value.dtype == torch.float32 and self.device == "cuda":
-                    inputs[key] = inputs[key].to(torch.float16)
-        outputs = self.model.generate(
-            **inputs,
-            max_new_tokens=128,
-            do_sample=False,
-            num_beams=1,
+        autocast = (
+            torch.autocast(device_type=self.device, dtype=self._autocast_dtype)
+            if self._autocast_dtype is not None
+            else nullcontext()
         )
+        with torch.inference_mode(), autocast:
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=128,
+                do_sample=False,
+                num_beams=1,
+                use_cache=True,
+                pad_token_id=self.processor.tokenizer.pad_token_id,
+            )
         generated_ids = outputs[:, inputs["input_ids"].size(1) :]
-        response = self.processor.batch_decode(generated_ids, skip_special_tokens=True)
-        text = response[0].strip()
-        # Remove common prefixes like "Assistant:" that the model may generate
-        text = re.sub(r"^\s*\w+:\s*", "", text)
-        if text.startswith(":"):
-            text = text[1:].lstrip()
-        return text
+        responses = self.processor.batch_decode(generated_ids, skip_special_tokens=True)
+        return [self._clean_response(response) for response in responses]
+
+    def _select_autocast_dtype(self) -> "torch.dtype | None":
+        """
+        fp16 on CUDA for the int8 model, whose non-quantized layers stay in fp32,
+        bf16 on CPUs with native bf16 support, otherwise none. The full CUDA
+        model is already loaded in fp16, and fp16 autocast on plain x86 CPUs is
+        slower than fp32, so neither uses it.
+        """
+        import torch
+
+        if self.device == "cuda":
+            return torch.float16 if self._quantized else None
+        if self.device == "cpu":
+            is_bf16_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+            if is_bf16_supported is not None and is_bf16_supported():
+                return torch.bfloat16
+        return None
+
+    @staticmethod
+    def _clean_response(text: str) -> str:
+        return _PREFIX_RE.sub("", text.strip(), count=1).strip()
+
+    def transcribe_np(self, audio: np.ndarray) -> str:
+        return self.transcribe_np_batch([audio])[0]
+
+    async def async_transcribe_np(self, audio: np.ndarray) -> str:
+        """
+        Queue the utterance and transcribe it together with any other
+        utterances that arrive within the micro-batch window.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((audio, future))
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._run_batch())
+        return await future
+
+    async def _run_batch(self) -> None:
+        # Utterances queued while a batch is being transcribed go in the next
+        # batch, since async_transcribe_np only starts a task when none runs
+        while self._pending:
+            await asyncio.sleep(BATCH_WINDOW_SECONDS)
+            batch, self._pending = self._pending, []
+            try:
+                texts = await asyncio.to_thread(
+                    self.transcribe_np_batch, [audio for audio, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
@@ -1,7 +1,11 @@
 import numpy as np
-import whisper
 from .asr_interface import ASRInterface
 
+# whisper.transcribe's default thresholds
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+COMPRESSION_RATIO_THRESHOLD = 2.4
+
 
 class VoiceRecognition(ASRInterface):
     def __init__(
@@ -10,13 +14,45 @@ class VoiceRecognition(ASRInterface):
         download_root: str = None,
         device="cpu",
     ) -> None:
+        # Imported here so selecting another ASR backend never loads torch
+        import whisper
+
         self.model = whisper.load_model(
             name=name,
             device=device,
             download_root=download_root,
         )
+        self.decoding_options = whisper.DecodingOptions(
+            without_timestamps=True, fp16=self.model.device.type == "cuda"
+        )
 
     def transcribe_np(self, audio: np.ndarray) -> str:
-        result = self.model.transcribe(audio)
-        full_text = result['text']
-        return full_text
+        import whisper
+
+        audio = self._prep_audio(audio)
+        if audio.shape[-1] > whisper.audio.N_SAMPLES:
+            # Longer than one 30 s window, needs transcribe's sliding window
+            result = self.model.transcribe(audio)
+            return result["text"]
+
+        # Utterances fit in a single window: decode it directly and skip
+        # transcribe's seek loop and timestamp handling
+        mel = whisper.log_mel_spectrogram(
+            whisper.pad_or_trim(audio),
+            n_mels=self.model.dims.n_mels,
+            device=self.model.device,
+        )
+        result = whisper.decode(self.model, mel, self.decoding_options)
+
+        # Apply transcribe's gating to the greedy result: likely silence is
+        # dropped, and any other doubtful decode goes through transcribe,
+        # which retries at higher temperatures
+        silence = result.no_speech_prob > NO_SPEECH_THRESHOLD
+        if silence and result.avg_logprob <= LOGPROB_THRESHOLD:
+            return ""
+        if not silence and (
+            result.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+            or result.avg_logprob < LOGPROB_THRESHOLD
+        ):
+            return self.model.transcribe(audio)["text"]
+        return result.text.strip()
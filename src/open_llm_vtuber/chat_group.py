@@ -1,11 +1,17 @@
-from typing import Dict, List, Optional, Set, Tuple, Callable, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, Callable, Any
 from dataclasses import dataclass
+from itertools import chain
 from fastapi import WebSocket
-import json
+import asyncio
 from loguru import logger
 
+from .utils.json_utils import dumps
 
-@dataclass
+# Maximum number of members sent to concurrently in one broadcast batch
+BROADCAST_BATCH_SIZE = 50
+
+
+@dataclass(slots=True)
 class Group:
     group_id: str
     owner_uid: str
@@ -16,6 +22,24 @@ class ChatGroupManager:
     def __init__(self):
         self.client_group_map: Dict[str, str] = {}  # client_uid -> group_id
         self.groups: Dict[str, Group] = {}  # group_id -> Group
+        self.clients: Set[str] = set()  # client_uids of registered clients
+
+    def register_client(self, client_uid: str) -> None:
+        """
+        Register a connected client. Clients without an entry in
+        client_group_map are not in any group.
+        """
+        self.clients.add(client_uid)
+
+    def on_disconnect(self, client_uid: str) -> List[str]:
+        """
+        Unregister a client as soon as its connection closes, so the
+        membership state never has to be reconciled by a periodic sweep.
+
+        Returns:
+            List[str]: Members of the client's group before it left
+        """
+        return self.remove_client(client_uid)
 
     def create_group_for_client(self, client_uid: str) -> str:
         group_id = f"group_{client_uid}"
@@ -33,12 +57,12 @@ class ChatGroupManager:
         If inviter is not in a group, create one
         Returns (success, message)
         """
-        # Check if invitee exists in client map (connected)
-        if invitee_uid not in self.client_group_map:
+        # Check if invitee exists (connected)
+        if invitee_uid not in self.clients:
             return False, f"Invitee {invitee_uid} does not exist"
 
         # Check if invitee is already in a group
-        if invitee_uid in self.client_group_map and self.client_group_map[invitee_uid]:
+        if invitee_uid in self.client_group_map:
             return False, f"Invitee {invitee_uid} is already in a group"
 
         # If inviter is not in a group, create one
@@ -81,15 +105,14 @@ class ChatGroupManager:
 
         # Remove target from group
         group.members.remove(target_uid)
-        self.client_group_map[target_uid] = ""  # Empty string means not in any group
+        self.client_group_map.pop(target_uid, None)
 
         # If group becomes empty or only has owner, delete it
         if len(group.members) <= 1:
             # Remove owner from group too
             if group.members:
-                owner_uid = next(iter(group.members))
-                group.members.remove(owner_uid)
-                self.client_group_map[owner_uid] = ""
+                owner_uid = group.members.pop()
+                self.client_group_map.pop(owner_uid, None)
             del self.groups[target_group_id]
             logger.info(f"Removed empty group {target_group_id}")
 
@@ -103,18 +126,16 @@ class ChatGroupManager:
         Returns:
             List[str]: List of remaining group members
         """
-        group_id = self.client_group_map.get(client_uid)
-        if not group_id or group_id not in self.groups:
+        self.clients.discard(client_uid)
+        group_id = self.client_group_map.pop(client_uid, None)
+        group = self.groups.get(group_id) if group_id else None
+        if group is None:
             return []
 
-        group = self.groups[group_id]
         affected_members = list(group.members)
 
         # Remove client from group
-        if client_uid in group.members:
-            group.members.remove(client_uid)
-        if client_uid in self.client_group_map:
-            del self.client_group_map[client_uid]
+        group.members.discard(client_uid)
 
         # If client was owner, assign new owner or delete group
         if group.owner_uid == client_uid:
@@ -136,10 +157,13 @@ class ChatGroupManager:
         return affected_members
 
     def cleanup_disconnected_clients(self, connected_clients: Set[str]):
-        """Remove all disconnected clients from groups"""
-        disconnected_clients = set(self.client_group_map.keys()) - connected_clients
-        for client_uid in disconnected_clients:
-            self.remove_client(client_uid)
+        """
+        Remove all disconnected clients from groups.
+        Disconnects are normally handled by on_disconnect, so this only
+        touches clients that left without going through it.
+        """
+        for client_uid in self.clients - connected_clients:
+            self.on_disconnect(client_uid)
 
     def get_client_group(self, client_uid: str) -> Optional[Group]:
         """
@@ -155,6 +179,14 @@ class ChatGroupManager:
         group = self.get_client_group(client_uid)
         return list(group.members) if group else []
 
+    def iter_group_members(self, client_uid: str) -> Iterable[str]:
+        """
+        Iterate over the members in the client's group without copying them.
+        Consume the result before the group is modified.
+        """
+        group = self.get_client_group(client_uid)
+        return group.members if group else ()
+
     def get_group_by_id(self, group_id: str) -> Optional[Group]:
         """Get group by group ID"""
         return self.groups.get(group_id)
@@ -171,9 +203,12 @@ async def handle_group_operation(
     """Handle group-related operations"""
     if target_uid:
         # Get all affected members before operation
-        old_members = chat_group_manager.get_group_members(client_uid)
-        target_old_members = chat_group_manager.get_group_members(target_uid)
-        all_affected_members = set(old_members + target_old_members)
+        all_affected_members = set(
+            chain(
+                chat_group_manager.iter_group_members(client_uid),
+                chat_group_manager.iter_group_members(target_uid),
+            )
+        )
 
         if operation == "add-client-to-group":
             success, message = chat_group_manager.add_client_to_group(
@@ -186,7 +221,7 @@ async def handle_group_operation(
                     await send_group_update(client_connections[target_uid], target_uid)
                     # Notify the invited member
                     await client_connections[target_uid].send_text(
-                        json.dumps(
+                        dumps(
                             {
                                 "type": "group-operation-result",
                                 "success": True,
@@ -204,7 +239,7 @@ async def handle_group_operation(
 
         # Send operation result to the initiator
         await client_connections[client_uid].send_text(
-            json.dumps(
+            dumps(
                 {
                     "type": "group-operation-result",
                     "success": success,
@@ -219,7 +254,7 @@ async def handle_group_operation(
                 try:
                     await send_group_update(client_connections[target_uid], target_uid)
                     await client_connections[target_uid].send_text(
-                        json.dumps(
+                        dumps(
                             {
                                 "type": "group-operation-result",
                                 "success": True,
@@ -231,32 +266,38 @@ async def handle_group_operation(
                     logger.error(f"Failed to update removed member {target_uid}: {e}")
 
             # Get new group members after operation
-            new_members = chat_group_manager.get_group_members(client_uid)
-            all_affected_members.update(new_members)
-
-            # Update remaining group members
-            for member_uid in all_affected_members:
-                if member_uid in client_connections and member_uid != target_uid:
-                    try:
-                        await send_group_update(
-                            client_connections[member_uid], member_uid
-                        )
-                        if member_uid != client_uid:
-                            await client_connections[member_uid].send_text(
-                                json.dumps(
-                                    {
-                                        "type": "group-operation-result",
-                                        "success": True,
-                                        "message": (
-                                            f"Member {target_uid} was "
-                                            f"{'added to' if operation == 'add-client-to-group' else 'removed from'} "
-                                            "the group"
-                                        ),
-                                    }
-                                )
-                            )
-                    except Exception as e:
-                        logger.error(f"Failed to update member {member_uid}: {e}")
+            all_affected_members.update(
+                chat_group_manager.iter_group_members(client_uid)
+            )
+
+            # Encode the member notification once for the whole fan-out
+            verb = "added to" if operation == "add-client-to-group" else "removed from"
+            notify_payload = dumps(
+                {
+                    "type": "group-operation-result",
+                    "success": True,
+                    "message": f"Member {target_uid} was {verb} the group",
+                }
+            )
+
+            async def update_member(member_uid: str) -> None:
+                await send_group_update(client_connections[member_uid], member_uid)
+                if member_uid != client_uid:
+                    await client_connections[member_uid].send_text(notify_payload)
+
+            # Update remaining group members concurrently
+            member_uids = [
+                member_uid
+                for member_uid in all_affected_members
+                if member_uid in client_connections and member_uid != target_uid
+            ]
+            results = await asyncio.gather(
+                *(update_member(member_uid) for member_uid in member_uids),
+                return_exceptions=True,
+            )
+            for member_uid, result in zip(member_uids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to update member {member_uid}: {result}")
 
 
 async def handle_client_disconnect(
@@ -266,34 +307,61 @@ async def handle_client_disconnect(
     send_group_update: Callable,
 ) -> None:
     """Handle client disconnection from group"""
-    old_group_members = chat_group_manager.get_group_members(client_uid)
-    chat_group_manager.remove_client(client_uid)
-
-    # Send updates to remaining group members
-    for member_uid in old_group_members:
-        if member_uid != client_uid and member_uid in client_connections:
-            await send_group_update(client_connections[member_uid], member_uid)
-            await client_connections[member_uid].send_text(
-                json.dumps(
-                    {
-                        "type": "group-operation-result",
-                        "success": True,
-                        "message": f"Member {client_uid} disconnected",
-                    }
-                )
-            )
+    old_group_members = chat_group_manager.on_disconnect(client_uid)
+
+    payload = dumps(
+        {
+            "type": "group-operation-result",
+            "success": True,
+            "message": f"Member {client_uid} disconnected",
+        }
+    )
+
+    async def update_member(member_uid: str) -> None:
+        await send_group_update(client_connections[member_uid], member_uid)
+        await client_connections[member_uid].send_text(payload)
+
+    # Send updates to remaining group members concurrently
+    member_uids = [
+        member_uid
+        for member_uid in old_group_members
+        if member_uid != client_uid and member_uid in client_connections
+    ]
+    results = await asyncio.gather(
+        *(update_member(member_uid) for member_uid in member_uids),
+        return_exceptions=True,
+    )
+    for member_uid, result in zip(member_uids, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to update member {member_uid}: {result}")
 
 
 async def broadcast_to_group(
     group_members: List[str],
-    message: Dict[str, Any],
+    message: Union[Dict[str, Any], str],
     client_connections: Dict[str, WebSocket],
     exclude_uid: Optional[str] = None,
 ) -> None:
-    """Broadcasts a message to all members in a group except the sender"""
-    for member_uid in group_members:
-        if member_uid != exclude_uid and member_uid in client_connections:
-            try:
-                await client_connections[member_uid].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to broadcast to {member_uid}: {e}")
+    """
+    Broadcasts a message to all members in a group except the sender.
+    A str message is treated as an already-encoded JSON payload.
+    """
+    payload = message if isinstance(message, str) else dumps(message)
+    member_uids = [
+        member_uid
+        for member_uid in group_members
+        if member_uid != exclude_uid and member_uid in client_connections
+    ]
+    # Large groups are sent in batches, yielding to the event loop in between
+    # so other websocket traffic is not starved by one broadcast
+    for start in range(0, len(member_uids), BROADCAST_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(0)
+        batch = member_uids[start : start + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(client_connections[uid].send_text(payload) for uid in batch),
+            return_exceptions=True,
+        )
+        for member_uid, result in zip(batch, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to broadcast to {member_uid}: {result}")
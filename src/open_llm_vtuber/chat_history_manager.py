@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import json
@@ -147,6 +148,30 @@ def store_message(
     logger.debug(f"Successfully stored {role} message")
 
 
+async def store_message_async(
+    conf_uid: str,
+    history_uid: str,
+    role: Literal["human", "ai", "system"],
+    content: str,
+    name: str | None = None,
+    avatar: str | None = None,
+) -> None:
+    """Store a message like store_message, running the file I/O in a worker thread
+
+    Writes to different history files can be awaited concurrently; writes to
+    the same history file must still be awaited one after another.
+    """
+    await asyncio.to_thread(
+        store_message,
+        conf_uid=conf_uid,
+        history_uid=history_uid,
+        role=role,
+        content=content,
+        name=name,
+        avatar=avatar,
+    )
+
+
 def get_metadata(conf_uid: str, history_uid: str) -> dict:
     """Get metadata from history file"""
     if not conf_uid or not history_uid:
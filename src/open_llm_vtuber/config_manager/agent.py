@@ -4,7 +4,8 @@ different types of agents.
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, ClassVar, Optional, Literal
+from types import MappingProxyType
+from typing import Dict, ClassVar, Optional, Literal, Mapping
 from .i18n import I18nMixin, Description
 from .stateless_llm import StatelessLLMConfigs
 
@@ -30,20 +31,22 @@ class BasicMemoryAgentConfig(I18nMixin, BaseModel):
 
     faster_first_response: Optional[bool] = Field(True, alias="faster_first_response")
     segment_method: Literal["regex", "pysbd"] = Field("pysbd", alias="segment_method")
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "llm_provider": Description(
-            en="LLM provider to use for this agent",
-            zh="Basic Memory Agent 智能体使用的大语言模型选项",
-        ),
-        "faster_first_response": Description(
-            en="Whether to respond as soon as encountering a comma in the first sentence to reduce latency (default: True)",
-            zh="是否在第一句回应时遇上逗号就直接生成音频以减少首句延迟（默认：True）",
-        ),
-        "segment_method": Description(
-            en="Method for segmenting sentences: 'regex' or 'pysbd' (default: 'pysbd')",
-            zh="分割句子的方法：'regex' 或 'pysbd'（默认：'pysbd'）",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "llm_provider": Description(
+                en="LLM provider to use for this agent",
+                zh="Basic Memory Agent 智能体使用的大语言模型选项",
+            ),
+            "faster_first_response": Description(
+                en="Whether to respond as soon as encountering a comma in the first sentence to reduce latency (default: True)",
+                zh="是否在第一句回应时遇上逗号就直接生成音频以减少首句延迟（默认：True）",
+            ),
+            "segment_method": Description(
+                en="Method for segmenting sentences: 'regex' or 'pysbd' (default: 'pysbd')",
+                zh="分割句子的方法：'regex' 或 'pysbd'（默认：'pysbd'）",
+            ),
+        }
+    )
 
 
 class Mem0VectorStoreConfig(I18nMixin, BaseModel):
@@ -52,14 +55,17 @@ class Mem0VectorStoreConfig(I18nMixin, BaseModel):
     provider: str = Field(..., alias="provider")
     config: Dict = Field(..., alias="config")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "provider": Description(
-            en="Vector store provider (e.g., qdrant)", zh="向量存储提供者（如 qdrant）"
-        ),
-        "config": Description(
-            en="Provider-specific configuration", zh="提供者特定配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "provider": Description(
+                en="Vector store provider (e.g., qdrant)",
+                zh="向量存储提供者（如 qdrant）",
+            ),
+            "config": Description(
+                en="Provider-specific configuration", zh="提供者特定配置"
+            ),
+        }
+    )
 
 
 class Mem0LLMConfig(I18nMixin, BaseModel):
@@ -68,12 +74,14 @@ class Mem0LLMConfig(I18nMixin, BaseModel):
     provider: str = Field(..., alias="provider")
     config: Dict = Field(..., alias="config")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "provider": Description(en="LLM provider name", zh="语言模型提供者名称"),
-        "config": Description(
-            en="Provider-specific configuration", zh="提供者特定配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "provider": Description(en="LLM provider name", zh="语言模型提供者名称"),
+            "config": Description(
+                en="Provider-specific configuration", zh="提供者特定配置"
+            ),
+        }
+    )
 
 
 class Mem0EmbedderConfig(I18nMixin, BaseModel):
@@ -82,12 +90,16 @@ class Mem0EmbedderConfig(I18nMixin, BaseModel):
     provider: str = Field(..., alias="provider")
     config: Dict = Field(..., alias="config")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "provider": Description(en="Embedder provider name", zh="嵌入模型提供者名称"),
-        "config": Description(
-            en="Provider-specific configuration", zh="提供者特定配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "provider": Description(
+                en="Embedder provider name", zh="嵌入模型提供者名称"
+            ),
+            "config": Description(
+                en="Provider-specific configuration", zh="提供者特定配置"
+            ),
+        }
+    )
 
 
 class Mem0Config(I18nMixin, BaseModel):
@@ -97,11 +109,15 @@ class Mem0Config(I18nMixin, BaseModel):
     llm: Mem0LLMConfig = Field(..., alias="llm")
     embedder: Mem0EmbedderConfig = Field(..., alias="embedder")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "vector_store": Description(en="Vector store configuration", zh="向量存储配置"),
-        "llm": Description(en="LLM configuration", zh="语言模型配置"),
-        "embedder": Description(en="Embedder configuration", zh="嵌入模型配置"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "vector_store": Description(
+                en="Vector store configuration", zh="向量存储配置"
+            ),
+            "llm": Description(en="LLM configuration", zh="语言模型配置"),
+            "embedder": Description(en="Embedder configuration", zh="嵌入模型配置"),
+        }
+    )
 
 
 # =================================
@@ -115,22 +131,24 @@ class HumeAIConfig(I18nMixin, BaseModel):
     config_id: Optional[str] = Field(None, alias="config_id")
     idle_timeout: int = Field(15, alias="idle_timeout")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_key": Description(
-            en="API key for Hume AI service", zh="Hume AI 服务的 API 密钥"
-        ),
-        "host": Description(
-            en="Host URL for Hume AI service (default: api.hume.ai)",
-            zh="Hume AI 服务的主机地址（默认：api.hume.ai）",
-        ),
-        "config_id": Description(
-            en="Configuration ID for EVI settings", zh="EVI 配置 ID"
-        ),
-        "idle_timeout": Description(
-            en="Idle timeout in seconds before disconnecting (default: 15)",
-            zh="空闲超时断开连接的秒数（默认：15）",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_key": Description(
+                en="API key for Hume AI service", zh="Hume AI 服务的 API 密钥"
+            ),
+            "host": Description(
+                en="Host URL for Hume AI service (default: api.hume.ai)",
+                zh="Hume AI 服务的主机地址（默认：api.hume.ai）",
+            ),
+            "config_id": Description(
+                en="Configuration ID for EVI settings", zh="EVI 配置 ID"
+            ),
+            "idle_timeout": Description(
+                en="Idle timeout in seconds before disconnecting (default: 15)",
+                zh="空闲超时断开连接的秒数（默认：15）",
+            ),
+        }
+    )
 
 
 class AgentSettings(I18nMixin, BaseModel):
@@ -142,15 +160,19 @@ class AgentSettings(I18nMixin, BaseModel):
     mem0_agent: Optional[Mem0Config] = Field(None, alias="mem0_agent")
     hume_ai_agent: Optional[HumeAIConfig] = Field(None, alias="hume_ai_agent")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "basic_memory_agent": Description(
-            en="Configuration for basic memory agent", zh="基础记忆代理配置"
-        ),
-        "mem0_agent": Description(en="Configuration for Mem0 agent", zh="Mem0代理配置"),
-        "hume_ai_agent": Description(
-            en="Configuration for Hume AI agent", zh="Hume AI 代理配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "basic_memory_agent": Description(
+                en="Configuration for basic memory agent", zh="基础记忆代理配置"
+            ),
+            "mem0_agent": Description(
+                en="Configuration for Mem0 agent", zh="Mem0代理配置"
+            ),
+            "hume_ai_agent": Description(
+                en="Configuration for Hume AI agent", zh="Hume AI 代理配置"
+            ),
+        }
+    )
 
 
 class AgentConfig(I18nMixin, BaseModel):
@@ -162,14 +184,16 @@ class AgentConfig(I18nMixin, BaseModel):
     agent_settings: AgentSettings = Field(..., alias="agent_settings")
     llm_configs: StatelessLLMConfigs = Field(..., alias="llm_configs")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "conversation_agent_choice": Description(
-            en="Type of conversation agent to use", zh="要使用的对话代理类型"
-        ),
-        "agent_settings": Description(
-            en="Settings for different agent types", zh="不同代理类型的设置"
-        ),
-        "llm_configs": Description(
-            en="Pool of LLM provider configurations", zh="语言模型提供者配置池"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "conversation_agent_choice": Description(
+                en="Type of conversation agent to use", zh="要使用的对话代理类型"
+            ),
+            "agent_settings": Description(
+                en="Settings for different agent types", zh="不同代理类型的设置"
+            ),
+            "llm_configs": Description(
+                en="Pool of LLM provider configurations", zh="语言模型提供者配置池"
+            ),
+        }
+    )
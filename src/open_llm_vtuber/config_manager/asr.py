@@ -1,6 +1,7 @@
 # config_manager/asr.py
 from pydantic import ValidationInfo, Field, model_validator
-from typing import Literal, Optional, Dict, ClassVar
+from types import MappingProxyType
+from typing import Literal, Optional, ClassVar, Mapping
 from .i18n import I18nMixin, Description
 
 
@@ -11,18 +12,20 @@ class AzureASRConfig(I18nMixin):
     region: str = Field(..., alias="region")
     languages: list[str] = Field(["en-US", "zh-CN"], alias="languages")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_key": Description(
-            en="API key for Azure ASR service", zh="Azure ASR 服务的 API 密钥"
-        ),
-        "region": Description(
-            en="Azure region (e.g., eastus)", zh="Azure 区域（如 eastus)"
-        ),
-        "languages": Description(
-            en="List of languages to detect (e.g., ['en-US', 'zh-CN'])",
-            zh="要检测的语言列表（如 ['en-US', 'zh-CN'])",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_key": Description(
+                en="API key for Azure ASR service", zh="Azure ASR 服务的 API 密钥"
+            ),
+            "region": Description(
+                en="Azure region (e.g., eastus)", zh="Azure 区域（如 eastus)"
+            ),
+            "languages": Description(
+                en="List of languages to detect (e.g., ['en-US', 'zh-CN'])",
+                zh="要检测的语言列表（如 ['en-US', 'zh-CN'])",
+            ),
+        }
+    )
 
 
 class FasterWhisperConfig(I18nMixin):
@@ -32,23 +35,32 @@ class FasterWhisperConfig(I18nMixin):
     download_root: str = Field(..., alias="download_root")
     language: Optional[str] = Field(None, alias="language")
     device: Literal["auto", "cpu", "cuda"] = Field("auto", alias="device")
-
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "model_path": Description(
-            en="Path to the Faster Whisper model", zh="Faster Whisper 模型路径"
-        ),
-        "download_root": Description(
-            en="Root directory for downloading models", zh="模型下载根目录"
-        ),
-        "language": Description(
-            en="Language code (e.g., en, zh) or None for auto-detect",
-            zh="语言代码（如 en, zh）或留空以自动检测",
-        ),
-        "device": Description(
-            en="Device to use for inference (cpu, cuda, or auto)",
-            zh="推理设备（cpu、cuda 或 auto）",
-        ),
-    }
+    compute_type: str = Field("auto", alias="compute_type")
+
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "model_path": Description(
+                en="Path to the Faster Whisper model", zh="Faster Whisper 模型路径"
+            ),
+            "download_root": Description(
+                en="Root directory for downloading models", zh="模型下载根目录"
+            ),
+            "language": Description(
+                en="Language code (e.g., en, zh) or None for auto-detect",
+                zh="语言代码（如 en, zh）或留空以自动检测",
+            ),
+            "device": Description(
+                en="Device to use for inference (cpu, cuda, or auto)",
+                zh="推理设备（cpu、cuda 或 auto）",
+            ),
+            "compute_type": Description(
+                en="CTranslate2 compute type (e.g. int8, float16, float32), or auto "
+                "for int8 on CPU and float16 on CUDA",
+                zh="CTranslate2 计算类型（如 int8、float16、float32），"
+                "auto 表示 CPU 使用 int8，CUDA 使用 float16",
+            ),
+        }
+    )
 
 
 class WhisperCPPConfig(I18nMixin):
@@ -60,23 +72,25 @@ class WhisperCPPConfig(I18nMixin):
     print_progress: bool = Field(False, alias="print_progress")
     language: Literal["auto", "en", "zh"] = Field("auto", alias="language")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "model_name": Description(
-            en="Name of the Whisper model", zh="Whisper 模型名称"
-        ),
-        "model_dir": Description(
-            en="Directory containing Whisper models", zh="Whisper 模型目录"
-        ),
-        "print_realtime": Description(
-            en="Print output in real-time", zh="实时打印输出"
-        ),
-        "print_progress": Description(
-            en="Print progress information", zh="打印进度信息"
-        ),
-        "language": Description(
-            en="Language code (en, zh, or auto)", zh="语言代码（en、zh 或 auto）"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "model_name": Description(
+                en="Name of the Whisper model", zh="Whisper 模型名称"
+            ),
+            "model_dir": Description(
+                en="Directory containing Whisper models", zh="Whisper 模型目录"
+            ),
+            "print_realtime": Description(
+                en="Print output in real-time", zh="实时打印输出"
+            ),
+            "print_progress": Description(
+                en="Print progress information", zh="打印进度信息"
+            ),
+            "language": Description(
+                en="Language code (en, zh, or auto)", zh="语言代码（en、zh 或 auto）"
+            ),
+        }
+    )
 
 
 class WhisperConfig(I18nMixin):
@@ -86,15 +100,18 @@ class WhisperConfig(I18nMixin):
     download_root: str = Field(..., alias="download_root")
     device: Literal["cpu", "cuda"] = Field("cpu", alias="device")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "name": Description(en="Name of the Whisper model", zh="Whisper 模型名称"),
-        "download_root": Description(
-            en="Root directory for downloading models", zh="模型下载根目录"
-        ),
-        "device": Description(
-            en="Device to use for inference (cpu or cuda)", zh="推理设备（cpu 或 cuda）"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "name": Description(en="Name of the Whisper model", zh="Whisper 模型名称"),
+            "download_root": Description(
+                en="Root directory for downloading models", zh="模型下载根目录"
+            ),
+            "device": Description(
+                en="Device to use for inference (cpu or cuda)",
+                zh="推理设备（cpu 或 cuda）",
+            ),
+        }
+    )
 
 
 class FunASRConfig(I18nMixin):
@@ -110,34 +127,39 @@ class FunASRConfig(I18nMixin):
     use_itn: bool = Field(False, alias="use_itn")
     language: Literal["auto", "zh", "en"] = Field("auto", alias="language")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "model_name": Description(en="Name of the FunASR model", zh="FunASR 模型名称"),
-        "vad_model": Description(
-            en="Voice Activity Detection model", zh="语音活动检测模型"
-        ),
-        "punc_model": Description(en="Punctuation model", zh="标点符号模型"),
-        "device": Description(
-            en="Device to use for inference (cpu or cuda)", zh="推理设备（cpu 或 cuda）"
-        ),
-        "disable_update": Description(
-            en="Disable checking for FunASR updates on launch",
-            zh="启动时禁用 FunASR 更新检查",
-        ),
-        "ncpu": Description(
-            en="Number of CPU threads for internal operations",
-            zh="内部操作的 CPU 线程数",
-        ),
-        "hub": Description(
-            en="Model hub to use (ms for ModelScope, hf for Hugging Face)",
-            zh="使用的模型仓库（ms 为 ModelScope，hf 为 Hugging Face）",
-        ),
-        "use_itn": Description(
-            en="Enable inverse text normalization", zh="启用反向文本归一化"
-        ),
-        "language": Description(
-            en="Language code (zh, en, or auto)", zh="语言代码（zh、en 或 auto）"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "model_name": Description(
+                en="Name of the FunASR model", zh="FunASR 模型名称"
+            ),
+            "vad_model": Description(
+                en="Voice Activity Detection model", zh="语音活动检测模型"
+            ),
+            "punc_model": Description(en="Punctuation model", zh="标点符号模型"),
+            "device": Description(
+                en="Device to use for inference (cpu or cuda)",
+                zh="推理设备（cpu 或 cuda）",
+            ),
+            "disable_update": Description(
+                en="Disable checking for FunASR updates on launch",
+                zh="启动时禁用 FunASR 更新检查",
+            ),
+            "ncpu": Description(
+                en="Number of CPU threads for internal operations",
+                zh="内部操作的 CPU 线程数",
+            ),
+            "hub": Description(
+                en="Model hub to use (ms for ModelScope, hf for Hugging Face)",
+                zh="使用的模型仓库（ms 为 ModelScope，hf 为 Hugging Face）",
+            ),
+            "use_itn": Description(
+                en="Enable inverse text normalization", zh="启用反向文本归一化"
+            ),
+            "language": Description(
+                en="Language code (zh, en, or auto)", zh="语言代码（zh、en 或 auto）"
+            ),
+        }
+    )
 
 
 class GroqWhisperASRConfig(I18nMixin):
@@ -149,19 +171,21 @@ class GroqWhisperASRConfig(I18nMixin):
     )
     lang: Optional[str] = Field(None, alias="lang")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_key": Description(
-            en="API key for Groq Whisper ASR", zh="Groq Whisper ASR 的 API 密钥"
-        ),
-        "model": Description(
-            en="Name of the Groq Whisper model to use",
-            zh="要使用的 Groq Whisper 模型名称",
-        ),
-        "lang": Description(
-            en="Language code (leave empty for auto-detect)",
-            zh="语言代码（留空以自动检测）",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_key": Description(
+                en="API key for Groq Whisper ASR", zh="Groq Whisper ASR 的 API 密钥"
+            ),
+            "model": Description(
+                en="Name of the Groq Whisper model to use",
+                zh="要使用的 Groq Whisper 模型名称",
+            ),
+            "lang": Description(
+                en="Language code (leave empty for auto-detect)",
+                zh="语言代码（留空以自动检测）",
+            ),
+        }
+    )
 
 
 class SherpaOnnxASRConfig(I18nMixin):
@@ -191,47 +215,55 @@ class SherpaOnnxASRConfig(I18nMixin):
     use_itn: bool = Field(True, alias="use_itn")
     provider: Literal["cpu", "cuda"] = Field("cpu", alias="provider")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "model_type": Description(
-            en="Type of ASR model to use", zh="要使用的 ASR 模型类型"
-        ),
-        "encoder": Description(
-            en="Path to encoder model (for transducer)",
-            zh="编码器模型路径（用于 transducer）",
-        ),
-        "decoder": Description(
-            en="Path to decoder model (for transducer)",
-            zh="解码器模型路径（用于 transducer）",
-        ),
-        "joiner": Description(
-            en="Path to joiner model (for transducer)",
-            zh="连接器模型路径（用于 transducer）",
-        ),
-        "paraformer": Description(
-            en="Path to paraformer model", zh="Paraformer 模型路径"
-        ),
-        "nemo_ctc": Description(en="Path to NeMo CTC model", zh="NeMo CTC 模型路径"),
-        "wenet_ctc": Description(en="Path to WeNet CTC model", zh="WeNet CTC 模型路径"),
-        "tdnn_model": Description(en="Path to TDNN model", zh="TDNN 模型路径"),
-        "whisper_encoder": Description(
-            en="Path to Whisper encoder model", zh="Whisper 编码器模型路径"
-        ),
-        "whisper_decoder": Description(
-            en="Path to Whisper decoder model", zh="Whisper 解码器模型路径"
-        ),
-        "sense_voice": Description(
-            en="Path to SenseVoice model", zh="SenseVoice 模型路径"
-        ),
-        "tokens": Description(en="Path to tokens file", zh="词元文件路径"),
-        "num_threads": Description(en="Number of threads to use", zh="使用的线程数"),
-        "use_itn": Description(
-            en="Enable inverse text normalization", zh="启用反向文本归一化"
-        ),
-        "provider": Description(
-            en="Provider for inference (cpu or cuda) (cuda option needs additional settings. Please check our docs)",
-            zh="推理平台（cpu 或 cuda）(cuda 需要额外配置，请参考文档)",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "model_type": Description(
+                en="Type of ASR model to use", zh="要使用的 ASR 模型类型"
+            ),
+            "encoder": Description(
+                en="Path to encoder model (for transducer)",
+                zh="编码器模型路径（用于 transducer）",
+            ),
+            "decoder": Description(
+                en="Path to decoder model (for transducer)",
+                zh="解码器模型路径（用于 transducer）",
+            ),
+            "joiner": Description(
+                en="Path to joiner model (for transducer)",
+                zh="连接器模型路径（用于 transducer）",
+            ),
+            "paraformer": Description(
+                en="Path to paraformer model", zh="Paraformer 模型路径"
+            ),
+            "nemo_ctc": Description(
+                en="Path to NeMo CTC model", zh="NeMo CTC 模型路径"
+            ),
+            "wenet_ctc": Description(
+                en="Path to WeNet CTC model", zh="WeNet CTC 模型路径"
+            ),
+            "tdnn_model": Description(en="Path to TDNN model", zh="TDNN 模型路径"),
+            "whisper_encoder": Description(
+                en="Path to Whisper encoder model", zh="Whisper 编码器模型路径"
+            ),
+            "whisper_decoder": Description(
+                en="Path to Whisper decoder model", zh="Whisper 解码器模型路径"
+            ),
+            "sense_voice": Description(
+                en="Path to SenseVoice model", zh="SenseVoice 模型路径"
+            ),
+            "tokens": Description(en="Path to tokens file", zh="词元文件路径"),
+            "num_threads": Description(
+                en="Number of threads to use", zh="使用的线程数"
+            ),
+            "use_itn": Description(
+                en="Enable inverse text normalization", zh="启用反向文本归一化"
+            ),
+            "provider": Description(
+                en="Provider for inference (cpu or cuda) (cuda option needs additional settings. Please check our docs)",
+                zh="推理平台（cpu 或 cuda）(cuda 需要额外配置，请参考文档)",
+            ),
+        }
+    )
 
     @model_validator(mode="after")
     def check_model_paths(cls, values: "SherpaOnnxASRConfig", info: ValidationInfo):
@@ -281,16 +313,25 @@ class MERaLiONASRConfig(I18nMixin):
 
     model_path: str = Field(..., alias="model_path")
     device: Literal["auto", "cpu", "cuda"] = Field("auto", alias="device")
-
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "model_path": Description(
-            en="Path to the MERaLiON model", zh="MERaLiON 模型路径"
-        ),
-        "device": Description(
-            en="Device for inference (auto, cpu, or cuda)",
-            zh="用于推理的设备 (auto、cpu 或 cuda)",
-        ),
-    }
+    compile_model: bool = Field(False, alias="compile_model")
+
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "model_path": Description(
+                en="Path to the MERaLiON model", zh="MERaLiON 模型路径"
+            ),
+            "device": Description(
+                en="Device for inference (auto, cpu, or cuda)",
+                zh="用于推理的设备 (auto、cpu 或 cuda)",
+            ),
+            "compile_model": Description(
+                en="Compile the model with torch.compile on CUDA. Faster decoding "
+                "after warm-up, but the first transcriptions are slow",
+                zh="在 CUDA 上使用 torch.compile 编译模型。预热后解码更快，"
+                "但最初几次识别较慢",
+            ),
+        }
+    )
 
 
 class ASRConfig(I18nMixin):
@@ -319,29 +360,33 @@ class ASRConfig(I18nMixin):
     )
     meralion_asr: Optional[MERaLiONASRConfig] = Field(None, alias="meralion_asr")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "asr_model": Description(
-            en="Speech-to-text model to use", zh="要使用的语音识别模型"
-        ),
-        "azure_asr": Description(en="Configuration for Azure ASR", zh="Azure ASR 配置"),
-        "faster_whisper": Description(
-            en="Configuration for Faster Whisper", zh="Faster Whisper 配置"
-        ),
-        "whisper_cpp": Description(
-            en="Configuration for WhisperCPP", zh="WhisperCPP 配置"
-        ),
-        "whisper": Description(en="Configuration for Whisper", zh="Whisper 配置"),
-        "fun_asr": Description(en="Configuration for FunASR", zh="FunASR 配置"),
-        "groq_whisper_asr": Description(
-            en="Configuration for Groq Whisper ASR", zh="Groq Whisper ASR 配置"
-        ),
-        "sherpa_onnx_asr": Description(
-            en="Configuration for Sherpa Onnx ASR", zh="Sherpa Onnx ASR 配置"
-        ),
-        "meralion_asr": Description(
-            en="Configuration for MERaLiON ASR", zh="MERaLiON ASR 配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "asr_model": Description(
+                en="Speech-to-text model to use", zh="要使用的语音识别模型"
+            ),
+            "azure_asr": Description(
+                en="Configuration for Azure ASR", zh="Azure ASR 配置"
+            ),
+            "faster_whisper": Description(
+                en="Configuration for Faster Whisper", zh="Faster Whisper 配置"
+            ),
+            "whisper_cpp": Description(
+                en="Configuration for WhisperCPP", zh="WhisperCPP 配置"
+            ),
+            "whisper": Description(en="Configuration for Whisper", zh="Whisper 配置"),
+            "fun_asr": Description(en="Configuration for FunASR", zh="FunASR 配置"),
+            "groq_whisper_asr": Description(
+                en="Configuration for Groq Whisper ASR", zh="Groq Whisper ASR 配置"
+            ),
+            "sherpa_onnx_asr": Description(
+                en="Configuration for Sherpa Onnx ASR", zh="Sherpa Onnx ASR 配置"
+            ),
+            "meralion_asr": Description(
+                en="Configuration for MERaLiON ASR", zh="MERaLiON ASR 配置"
+            ),
+        }
+    )
 
     @model_validator(mode="after")
     def check_asr_config(cls, values: "ASRConfig", info: ValidationInfo):
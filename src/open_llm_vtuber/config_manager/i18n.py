@@ -1,5 +1,6 @@
 # config_manager/i18n.py
-from typing import Dict, ClassVar
+from types import MappingProxyType
+from typing import Dict, ClassVar, Mapping
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -81,7 +82,7 @@ class I18nMixin(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {}
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType({})
 
     @classmethod
     def get_field_description(
@@ -1,6 +1,7 @@
 # config_manager/main.py
 from pydantic import BaseModel, Field
-from typing import Dict, ClassVar
+from types import MappingProxyType
+from typing import ClassVar, Mapping
 
 from .system import SystemConfig
 from .character import CharacterConfig
@@ -15,11 +16,13 @@ class Config(I18nMixin, BaseModel):
     system_config: SystemConfig = Field(default=None, alias="system_config")
     character_config: CharacterConfig = Field(..., alias="character_config")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "system_config": Description(
-            en="System configuration settings", zh="系统配置设置"
-        ),
-        "character_config": Description(
-            en="Character configuration settings", zh="角色配置设置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "system_config": Description(
+                en="System configuration settings", zh="系统配置设置"
+            ),
+            "character_config": Description(
+                en="Character configuration settings", zh="角色配置设置"
+            ),
+        }
+    )
@@ -1,5 +1,6 @@
 # config_manager/llm.py
-from typing import ClassVar, Literal
+from types import MappingProxyType
+from typing import ClassVar, Literal, Mapping
 from pydantic import BaseModel, Field
 from .i18n import I18nMixin, Description
 
@@ -11,15 +12,17 @@ class StatelessLLMBaseConfig(I18nMixin):
     interrupt_method: Literal["system", "user"] = Field(
         "user", alias="interrupt_method"
     )
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        "interrupt_method": Description(
-            en="""The method to use for prompting the interruption signal.
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "interrupt_method": Description(
+                en="""The method to use for prompting the interruption signal.
             If the provider supports inserting system prompt anywhere in the chat memory, use "system". 
             Otherwise, use "user". You don't need to change this setting.""",
-            zh="""用于表示中断信号的方法(提示词模式)。如果LLM支持在聊天记忆中的任何位置插入系统提示词，请使用“system”。
+                zh="""用于表示中断信号的方法(提示词模式)。如果LLM支持在聊天记忆中的任何位置插入系统提示词，请使用“system”。
             否则，请使用“user”。您不需要更改此设置。""",
-        ),
-    }
+            ),
+        }
+    )
 
 
 class OpenAICompatibleConfig(StatelessLLMBaseConfig):
@@ -48,10 +51,12 @@ class OpenAICompatibleConfig(StatelessLLMBaseConfig):
         ),
     }
 
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        **StatelessLLMBaseConfig.DESCRIPTIONS,
-        **_OPENAI_COMPATIBLE_DESCRIPTIONS,
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            **StatelessLLMBaseConfig.DESCRIPTIONS,
+            **_OPENAI_COMPATIBLE_DESCRIPTIONS,
+        }
+    )
 
 
 # Ollama config is completely the same as OpenAICompatibleConfig
@@ -84,10 +89,12 @@ class OllamaConfig(OpenAICompatibleConfig):
         ),
     }
 
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        **OpenAICompatibleConfig.DESCRIPTIONS,
-        **_OLLAMA_DESCRIPTIONS,
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            **OpenAICompatibleConfig.DESCRIPTIONS,
+            **_OLLAMA_DESCRIPTIONS,
+        }
+    )
 
 
 class OpenAIConfig(OpenAICompatibleConfig):
@@ -155,7 +162,9 @@ class AzureOpenAIConfig(StatelessLLMBaseConfig):
             zh="Azure OpenAI 端点",
         ),
         "llm_api_key": Description(en="API key for authentication", zh="API 认证密钥"),
-        "api_version": Description(en="Azure OpenAI API version", zh="Azure OpenAI API 版本"),
+        "api_version": Description(
+            en="Azure OpenAI API version", zh="Azure OpenAI API 版本"
+        ),
         "deployment_name": Description(en="Deployment name", zh="部署名称"),
         "temperature": Description(
             en="What sampling temperature to use, between 0 and 2.",
@@ -163,10 +172,12 @@ class AzureOpenAIConfig(StatelessLLMBaseConfig):
         ),
     }
 
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        **StatelessLLMBaseConfig.DESCRIPTIONS,
-        **_AZURE_DESCRIPTIONS,
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            **StatelessLLMBaseConfig.DESCRIPTIONS,
+            **_AZURE_DESCRIPTIONS,
+        }
+    )
 
 
 class ClaudeConfig(StatelessLLMBaseConfig):
@@ -189,10 +200,12 @@ class ClaudeConfig(StatelessLLMBaseConfig):
         ),
     }
 
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        **StatelessLLMBaseConfig.DESCRIPTIONS,
-        **_CLAUDE_DESCRIPTIONS,
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            **StatelessLLMBaseConfig.DESCRIPTIONS,
+            **_CLAUDE_DESCRIPTIONS,
+        }
+    )
 
 
 class LlamaCppConfig(StatelessLLMBaseConfig):
@@ -209,10 +222,12 @@ class LlamaCppConfig(StatelessLLMBaseConfig):
         ),
     }
 
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        **StatelessLLMBaseConfig.DESCRIPTIONS,
-        **_LLAMA_DESCRIPTIONS,
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            **StatelessLLMBaseConfig.DESCRIPTIONS,
+            **_LLAMA_DESCRIPTIONS,
+        }
+    )
 
 
 class StatelessLLMConfigs(I18nMixin, BaseModel):
@@ -233,33 +248,39 @@ class StatelessLLMConfigs(I18nMixin, BaseModel):
     mistral_llm: MistralConfig | None = Field(None, alias="mistral_llm")
     azure_openai_llm: AzureOpenAIConfig | None = Field(None, alias="azure_openai_llm")
 
-    DESCRIPTIONS: ClassVar[dict[str, Description]] = {
-        "openai_compatible_llm": Description(
-            en="Configuration for OpenAI-compatible LLM providers",
-            zh="OpenAI兼容的语言模型提供者配置",
-        ),
-        "ollama_llm": Description(en="Configuration for Ollama", zh="Ollama 配置"),
-        "openai_llm": Description(
-            en="Configuration for Official OpenAI API", zh="官方 OpenAI API 配置"
-        ),
-        "gemini_llm": Description(
-            en="Configuration for Gemini API", zh="Gemini API 配置"
-        ),
-        "mistral_llm": Description(
-            en="Configuration for Mistral API", zh="Mistral API 配置"
-        ),
-        "zhipu_llm": Description(en="Configuration for Zhipu API", zh="Zhipu API 配置"),
-        "deepseek_llm": Description(
-            en="Configuration for Deepseek API", zh="Deepseek API 配置"
-        ),
-        "groq_llm": Description(en="Configuration for Groq API", zh="Groq API 配置"),
-        "claude_llm": Description(
-            en="Configuration for Claude API", zh="Claude API配置"
-        ),
-        "llama_cpp_llm": Description(
-            en="Configuration for local Llama.cpp", zh="本地Llama.cpp配置"
-        ),
-        "azure_openai_llm": Description(
-            en="Configuration for Azure OpenAI API", zh="Azure OpenAI API 配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "openai_compatible_llm": Description(
+                en="Configuration for OpenAI-compatible LLM providers",
+                zh="OpenAI兼容的语言模型提供者配置",
+            ),
+            "ollama_llm": Description(en="Configuration for Ollama", zh="Ollama 配置"),
+            "openai_llm": Description(
+                en="Configuration for Official OpenAI API", zh="官方 OpenAI API 配置"
+            ),
+            "gemini_llm": Description(
+                en="Configuration for Gemini API", zh="Gemini API 配置"
+            ),
+            "mistral_llm": Description(
+                en="Configuration for Mistral API", zh="Mistral API 配置"
+            ),
+            "zhipu_llm": Description(
+                en="Configuration for Zhipu API", zh="Zhipu API 配置"
+            ),
+            "deepseek_llm": Description(
+                en="Configuration for Deepseek API", zh="Deepseek API 配置"
+            ),
+            "groq_llm": Description(
+                en="Configuration for Groq API", zh="Groq API 配置"
+            ),
+            "claude_llm": Description(
+                en="Configuration for Claude API", zh="Claude API配置"
+            ),
+            "llama_cpp_llm": Description(
+                en="Configuration for local Llama.cpp", zh="本地Llama.cpp配置"
+            ),
+            "azure_openai_llm": Description(
+                en="Configuration for Azure OpenAI API", zh="Azure OpenAI API 配置"
+            ),
+        }
+    )
@@ -1,6 +1,7 @@
 # config_manager/system.py
 from pydantic import Field, model_validator
-from typing import Dict, ClassVar
+from types import MappingProxyType
+from typing import Dict, ClassVar, Mapping
 from .i18n import I18nMixin, Description
 
 
@@ -13,18 +14,20 @@ class SystemConfig(I18nMixin):
     config_alts_dir: str = Field(..., alias="config_alts_dir")
     tool_prompts: Dict[str, str] = Field(..., alias="tool_prompts")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "conf_version": Description(en="Configuration version", zh="配置文件版本"),
-        "host": Description(en="Server host address", zh="服务器主机地址"),
-        "port": Description(en="Server port number", zh="服务器端口号"),
-        "config_alts_dir": Description(
-            en="Directory for alternative configurations", zh="备用配置目录"
-        ),
-        "tool_prompts": Description(
-            en="Tool prompts to be inserted into persona prompt",
-            zh="要插入到角色提示词中的工具提示词",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "conf_version": Description(en="Configuration version", zh="配置文件版本"),
+            "host": Description(en="Server host address", zh="服务器主机地址"),
+            "port": Description(en="Server port number", zh="服务器端口号"),
+            "config_alts_dir": Description(
+                en="Directory for alternative configurations", zh="备用配置目录"
+            ),
+            "tool_prompts": Description(
+                en="Tool prompts to be inserted into persona prompt",
+                zh="要插入到角色提示词中的工具提示词",
+            ),
+        }
+    )
 
     @model_validator(mode="after")
     def check_port(cls, values):
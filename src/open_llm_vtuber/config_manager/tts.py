@@ -1,6 +1,7 @@
 # config_manager/tts.py
 from pydantic import ValidationInfo, Field, model_validator
-from typing import Literal, Optional, Dict, ClassVar
+from types import MappingProxyType
+from typing import Literal, Optional, ClassVar, Mapping
 from .i18n import I18nMixin, Description
 
 
@@ -13,19 +14,21 @@ class AzureTTSConfig(I18nMixin):
     pitch: str = Field(..., alias="pitch")
     rate: str = Field(..., alias="rate")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_key": Description(
-            en="API key for Azure TTS service", zh="Azure TTS 服务的 API 密钥"
-        ),
-        "region": Description(
-            en="Azure region (e.g., eastus)", zh="Azure 区域（如 eastus）"
-        ),
-        "voice": Description(
-            en="Voice name to use for Azure TTS", zh="Azure TTS 使用的语音名称"
-        ),
-        "pitch": Description(en="Pitch adjustment percentage", zh="音高调整百分比"),
-        "rate": Description(en="Speaking rate adjustment", zh="语速调整"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_key": Description(
+                en="API key for Azure TTS service", zh="Azure TTS 服务的 API 密钥"
+            ),
+            "region": Description(
+                en="Azure region (e.g., eastus)", zh="Azure 区域（如 eastus）"
+            ),
+            "voice": Description(
+                en="Voice name to use for Azure TTS", zh="Azure TTS 使用的语音名称"
+            ),
+            "pitch": Description(en="Pitch adjustment percentage", zh="音高调整百分比"),
+            "rate": Description(en="Speaking rate adjustment", zh="语速调整"),
+        }
+    )
 
 
 class BarkTTSConfig(I18nMixin):
@@ -33,11 +36,13 @@ class BarkTTSConfig(I18nMixin):
 
     voice: str = Field(..., alias="voice")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "voice": Description(
-            en="Voice name to use for Bark TTS", zh="Bark TTS 使用的语音名称"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "voice": Description(
+                en="Voice name to use for Bark TTS", zh="Bark TTS 使用的语音名称"
+            ),
+        }
+    )
 
 
 class EdgeTTSConfig(I18nMixin):
@@ -45,12 +50,14 @@ class EdgeTTSConfig(I18nMixin):
 
     voice: str = Field(..., alias="voice")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "voice": Description(
-            en="Voice name to use for Edge TTS (use 'edge-tts --list-voices' to list available voices)",
-            zh="Edge TTS 使用的语音名称（使用 'edge-tts --list-voices' 列出可用语音）",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "voice": Description(
+                en="Voice name to use for Edge TTS (use 'edge-tts --list-voices' to list available voices)",
+                zh="Edge TTS 使用的语音名称（使用 'edge-tts --list-voices' 列出可用语音）",
+            ),
+        }
+    )
 
 
 class CosyvoiceTTSConfig(I18nMixin):
@@ -66,25 +73,28 @@ class CosyvoiceTTSConfig(I18nMixin):
     seed: int = Field(..., alias="seed")
     api_name: str = Field(..., alias="api_name")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "client_url": Description(
-            en="URL of the CosyVoice Gradio web UI", zh="CosyVoice Gradio Web UI 的 URL"
-        ),
-        "mode_checkbox_group": Description(
-            en="Mode checkbox group value", zh="模式复选框组值"
-        ),
-        "sft_dropdown": Description(en="SFT dropdown value", zh="SFT 下拉框值"),
-        "prompt_text": Description(en="Prompt text", zh="提示文本"),
-        "prompt_wav_upload_url": Description(
-            en="URL for prompt WAV file upload", zh="提示音频文件上传 URL"
-        ),
-        "prompt_wav_record_url": Description(
-            en="URL for prompt WAV file recording", zh="提示音频文件录制 URL"
-        ),
-        "instruct_text": Description(en="Instruction text", zh="指令文本"),
-        "seed": Description(en="Random seed", zh="随机种子"),
-        "api_name": Description(en="API endpoint name", zh="API 端点名称"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "client_url": Description(
+                en="URL of the CosyVoice Gradio web UI",
+                zh="CosyVoice Gradio Web UI 的 URL",
+            ),
+            "mode_checkbox_group": Description(
+                en="Mode checkbox group value", zh="模式复选框组值"
+            ),
+            "sft_dropdown": Description(en="SFT dropdown value", zh="SFT 下拉框值"),
+            "prompt_text": Description(en="Prompt text", zh="提示文本"),
+            "prompt_wav_upload_url": Description(
+                en="URL for prompt WAV file upload", zh="提示音频文件上传 URL"
+            ),
+            "prompt_wav_record_url": Description(
+                en="URL for prompt WAV file recording", zh="提示音频文件录制 URL"
+            ),
+            "instruct_text": Description(en="Instruction text", zh="指令文本"),
+            "seed": Description(en="Random seed", zh="随机种子"),
+            "api_name": Description(en="API endpoint name", zh="API 端点名称"),
+        }
+    )
 
 
 class Cosyvoice2TTSConfig(I18nMixin):
@@ -102,27 +112,30 @@ class Cosyvoice2TTSConfig(I18nMixin):
     speed: float = Field(..., alias="speed")
     api_name: str = Field(..., alias="api_name")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "client_url": Description(
-            en="URL of the CosyVoice Gradio web UI", zh="CosyVoice Gradio Web UI 的 URL"
-        ),
-        "mode_checkbox_group": Description(
-            en="Mode checkbox group value", zh="模式复选框组值"
-        ),
-        "sft_dropdown": Description(en="SFT dropdown value", zh="SFT 下拉框值"),
-        "prompt_text": Description(en="Prompt text", zh="提示文本"),
-        "prompt_wav_upload_url": Description(
-            en="URL for prompt WAV file upload", zh="提示音频文件上传 URL"
-        ),
-        "prompt_wav_record_url": Description(
-            en="URL for prompt WAV file recording", zh="提示音频文件录制 URL"
-        ),
-        "instruct_text": Description(en="Instruction text", zh="指令文本"),
-        "stream": Description(en="Streaming inference", zh="流式推理"),
-        "seed": Description(en="Random seed", zh="随机种子"),
-        "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
-        "api_name": Description(en="API endpoint name", zh="API 端点名称"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "client_url": Description(
+                en="URL of the CosyVoice Gradio web UI",
+                zh="CosyVoice Gradio Web UI 的 URL",
+            ),
+            "mode_checkbox_group": Description(
+                en="Mode checkbox group value", zh="模式复选框组值"
+            ),
+            "sft_dropdown": Description(en="SFT dropdown value", zh="SFT 下拉框值"),
+            "prompt_text": Description(en="Prompt text", zh="提示文本"),
+            "prompt_wav_upload_url": Description(
+                en="URL for prompt WAV file upload", zh="提示音频文件上传 URL"
+            ),
+            "prompt_wav_record_url": Description(
+                en="URL for prompt WAV file recording", zh="提示音频文件录制 URL"
+            ),
+            "instruct_text": Description(en="Instruction text", zh="指令文本"),
+            "stream": Description(en="Streaming inference", zh="流式推理"),
+            "seed": Description(en="Random seed", zh="随机种子"),
+            "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
+            "api_name": Description(en="API endpoint name", zh="API 端点名称"),
+        }
+    )
 
 
 class MeloTTSConfig(I18nMixin):
@@ -133,20 +146,22 @@ class MeloTTSConfig(I18nMixin):
     device: str = Field("auto", alias="device")
     speed: float = Field(1.0, alias="speed")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "speaker": Description(
-            en="Speaker name (e.g., EN-Default, ZH)",
-            zh="说话人名称（如 EN-Default、ZH）",
-        ),
-        "language": Description(
-            en="Language code (e.g., EN, ZH)", zh="语言代码（如 EN、ZH）"
-        ),
-        "device": Description(
-            en="Device to use (auto, cpu, cuda, cuda:0, mps)",
-            zh="使用的设备（auto、cpu、cuda、cuda:0、mps）",
-        ),
-        "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "speaker": Description(
+                en="Speaker name (e.g., EN-Default, ZH)",
+                zh="说话人名称（如 EN-Default、ZH）",
+            ),
+            "language": Description(
+                en="Language code (e.g., EN, ZH)", zh="语言代码（如 EN、ZH）"
+            ),
+            "device": Description(
+                en="Device to use (auto, cpu, cuda, cuda:0, mps)",
+                zh="使用的设备（auto、cpu、cuda、cuda:0、mps）",
+            ),
+            "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
+        }
+    )
 
 
 class XTTSConfig(I18nMixin):
@@ -156,17 +171,19 @@ class XTTSConfig(I18nMixin):
     speaker_wav: str = Field(..., alias="speaker_wav")
     language: str = Field(..., alias="language")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_url": Description(
-            en="URL of the XTTS API endpoint", zh="XTTS API 端点的 URL"
-        ),
-        "speaker_wav": Description(
-            en="Speaker reference WAV file", zh="说话人参考音频文件"
-        ),
-        "language": Description(
-            en="Language code (e.g., en, zh)", zh="语言代码（如 en、zh）"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_url": Description(
+                en="URL of the XTTS API endpoint", zh="XTTS API 端点的 URL"
+            ),
+            "speaker_wav": Description(
+                en="Speaker reference WAV file", zh="说话人参考音频文件"
+            ),
+            "language": Description(
+                en="Language code (e.g., en, zh)", zh="语言代码（如 en、zh）"
+            ),
+        }
+    )
 
 
 class GPTSoVITSConfig(I18nMixin):
@@ -182,23 +199,31 @@ class GPTSoVITSConfig(I18nMixin):
     media_type: str = Field(..., alias="media_type")
     streaming_mode: str = Field(..., alias="streaming_mode")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_url": Description(
-            en="URL of the GPT-SoVITS API endpoint", zh="GPT-SoVITS API 端点的 URL"
-        ),
-        "text_lang": Description(en="Language of the input text", zh="输入文本的语言"),
-        "ref_audio_path": Description(
-            en="Path to reference audio file", zh="参考音频文件路径"
-        ),
-        "prompt_lang": Description(en="Language of the prompt", zh="提示词语言"),
-        "prompt_text": Description(en="Prompt text", zh="提示文本"),
-        "text_split_method": Description(
-            en="Method for splitting text", zh="文本分割方法"
-        ),
-        "batch_size": Description(en="Batch size for processing", zh="处理批次大小"),
-        "media_type": Description(en="Output media type", zh="输出媒体类型"),
-        "streaming_mode": Description(en="Enable streaming mode", zh="启用流式模式"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_url": Description(
+                en="URL of the GPT-SoVITS API endpoint", zh="GPT-SoVITS API 端点的 URL"
+            ),
+            "text_lang": Description(
+                en="Language of the input text", zh="输入文本的语言"
+            ),
+            "ref_audio_path": Description(
+                en="Path to reference audio file", zh="参考音频文件路径"
+            ),
+            "prompt_lang": Description(en="Language of the prompt", zh="提示词语言"),
+            "prompt_text": Description(en="Prompt text", zh="提示文本"),
+            "text_split_method": Description(
+                en="Method for splitting text", zh="文本分割方法"
+            ),
+            "batch_size": Description(
+                en="Batch size for processing", zh="处理批次大小"
+            ),
+            "media_type": Description(en="Output media type", zh="输出媒体类型"),
+            "streaming_mode": Description(
+                en="Enable streaming mode", zh="启用流式模式"
+            ),
+        }
+    )
 
 
 class FishAPITTSConfig(I18nMixin):
@@ -209,21 +234,24 @@ class FishAPITTSConfig(I18nMixin):
     latency: Literal["normal", "balanced"] = Field(..., alias="latency")
     base_url: str = Field(..., alias="base_url")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "api_key": Description(
-            en="API key for Fish TTS service", zh="Fish TTS 服务的 API 密钥"
-        ),
-        "reference_id": Description(
-            en="Voice reference ID from Fish Audio website",
-            zh="来自 Fish Audio 网站的语音参考 ID",
-        ),
-        "latency": Description(
-            en="Latency mode (normal or balanced)", zh="延迟模式（normal 或 balanced）"
-        ),
-        "base_url": Description(
-            en="Base URL for Fish TTS API", zh="Fish TTS API 的基础 URL"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "api_key": Description(
+                en="API key for Fish TTS service", zh="Fish TTS 服务的 API 密钥"
+            ),
+            "reference_id": Description(
+                en="Voice reference ID from Fish Audio website",
+                zh="来自 Fish Audio 网站的语音参考 ID",
+            ),
+            "latency": Description(
+                en="Latency mode (normal or balanced)",
+                zh="延迟模式（normal 或 balanced）",
+            ),
+            "base_url": Description(
+                en="Base URL for Fish TTS API", zh="Fish TTS API 的基础 URL"
+            ),
+        }
+    )
 
 
 class CoquiTTSConfig(I18nMixin):
@@ -234,22 +262,24 @@ class CoquiTTSConfig(I18nMixin):
     language: str = Field(..., alias="language")
     device: str = Field("", alias="device")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "model_name": Description(
-            en="Name of the TTS model to use", zh="要使用的 TTS 模型名称"
-        ),
-        "speaker_wav": Description(
-            en="Path to speaker WAV file for voice cloning",
-            zh="用于声音克隆的说话人音频文件路径",
-        ),
-        "language": Description(
-            en="Language code (e.g., en, zh)", zh="语言代码（如 en、zh）"
-        ),
-        "device": Description(
-            en="Device to use (cuda, cpu, or empty for auto)",
-            zh="使用的设备（cuda、cpu 或留空以自动选择）",
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "model_name": Description(
+                en="Name of the TTS model to use", zh="要使用的 TTS 模型名称"
+            ),
+            "speaker_wav": Description(
+                en="Path to speaker WAV file for voice cloning",
+                zh="用于声音克隆的说话人音频文件路径",
+            ),
+            "language": Description(
+                en="Language code (e.g., en, zh)", zh="语言代码（如 en、zh）"
+            ),
+            "device": Description(
+                en="Device to use (cuda, cpu, or empty for auto)",
+                zh="使用的设备（cuda、cpu 或留空以自动选择）",
+            ),
+        }
+    )
 
 
 class SherpaOnnxTTSConfig(I18nMixin):
@@ -268,37 +298,43 @@ class SherpaOnnxTTSConfig(I18nMixin):
     speed: float = Field(1.0, alias="speed")
     debug: bool = Field(False, alias="debug")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "vits_model": Description(en="Path to VITS model file", zh="VITS 模型文件路径"),
-        "vits_lexicon": Description(
-            en="Path to lexicon file (optional)", zh="词典文件路径（可选）"
-        ),
-        "vits_tokens": Description(en="Path to tokens file", zh="词元文件路径"),
-        "vits_data_dir": Description(
-            en="Path to espeak-ng data directory (optional)",
-            zh="espeak-ng 数据目录路径（可选）",
-        ),
-        "vits_dict_dir": Description(
-            en="Path to Jieba dictionary directory (optional)",
-            zh="结巴词典目录路径（可选）",
-        ),
-        "tts_rule_fsts": Description(
-            en="Path to rule FSTs file (optional)", zh="规则 FST 文件路径（可选）"
-        ),
-        "max_num_sentences": Description(
-            en="Maximum number of sentences per batch", zh="每批次最大句子数"
-        ),
-        "sid": Description(
-            en="Speaker ID for multi-speaker models", zh="多说话人模型的说话人 ID"
-        ),
-        "provider": Description(
-            en="Computation provider (cpu, cuda, or coreml)",
-            zh="计算提供者（cpu、cuda 或 coreml）",
-        ),
-        "num_threads": Description(en="Number of computation threads", zh="计算线程数"),
-        "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
-        "debug": Description(en="Enable debug mode", zh="启用调试模式"),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "vits_model": Description(
+                en="Path to VITS model file", zh="VITS 模型文件路径"
+            ),
+            "vits_lexicon": Description(
+                en="Path to lexicon file (optional)", zh="词典文件路径（可选）"
+            ),
+            "vits_tokens": Description(en="Path to tokens file", zh="词元文件路径"),
+            "vits_data_dir": Description(
+                en="Path to espeak-ng data directory (optional)",
+                zh="espeak-ng 数据目录路径（可选）",
+            ),
+            "vits_dict_dir": Description(
+                en="Path to Jieba dictionary directory (optional)",
+                zh="结巴词典目录路径（可选）",
+            ),
+            "tts_rule_fsts": Description(
+                en="Path to rule FSTs file (optional)", zh="规则 FST 文件路径（可选）"
+            ),
+            "max_num_sentences": Description(
+                en="Maximum number of sentences per batch", zh="每批次最大句子数"
+            ),
+            "sid": Description(
+                en="Speaker ID for multi-speaker models", zh="多说话人模型的说话人 ID"
+            ),
+            "provider": Description(
+                en="Computation provider (cpu, cuda, or coreml)",
+                zh="计算提供者（cpu、cuda 或 coreml）",
+            ),
+            "num_threads": Description(
+                en="Number of computation threads", zh="计算线程数"
+            ),
+            "speed": Description(en="Speech speed multiplier", zh="语速倍数"),
+            "debug": Description(en="Enable debug mode", zh="启用调试模式"),
+        }
+    )
 
 
 class TTSConfig(I18nMixin):
@@ -317,6 +353,7 @@ class TTSConfig(I18nMixin):
         "fish_api_tts",
         "sherpa_onnx_tts",
     ] = Field(..., alias="tts_model")
+    max_concurrent_tasks: int = Field(3, ge=1, alias="max_concurrent_tasks")
 
     azure_tts: Optional[AzureTTSConfig] = Field(None, alias="azure_tts")
     bark_tts: Optional[BarkTTSConfig] = Field(None, alias="bark_tts")
@@ -332,32 +369,48 @@ class TTSConfig(I18nMixin):
         None, alias="sherpa_onnx_tts"
     )
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "tts_model": Description(
-            en="Text-to-speech model to use", zh="要使用的文本转语音模型"
-        ),
-        "azure_tts": Description(en="Configuration for Azure TTS", zh="Azure TTS 配置"),
-        "bark_tts": Description(en="Configuration for Bark TTS", zh="Bark TTS 配置"),
-        "edge_tts": Description(en="Configuration for Edge TTS", zh="Edge TTS 配置"),
-        "cosyvoice_tts": Description(
-            en="Configuration for Cosyvoice TTS", zh="Cosyvoice TTS 配置"
-        ),
-        "cosyvoice2_tts": Description(
-            en="Configuration for Cosyvoice2 TTS", zh="Cosyvoice2 TTS 配置"
-        ),
-        "melo_tts": Description(en="Configuration for Melo TTS", zh="Melo TTS 配置"),
-        "coqui_tts": Description(en="Configuration for Coqui TTS", zh="Coqui TTS 配置"),
-        "x_tts": Description(en="Configuration for XTTS", zh="XTTS 配置"),
-        "gpt_sovits_tts": Description(
-            en="Configuration for GPT-SoVITS", zh="GPT-SoVITS 配置"
-        ),
-        "fish_api_tts": Description(
-            en="Configuration for Fish API TTS", zh="Fish API TTS 配置"
-        ),
-        "sherpa_onnx_tts": Description(
-            en="Configuration for Sherpa Onnx TTS", zh="Sherpa Onnx TTS 配置"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {
+            "tts_model": Description(
+                en="Text-to-speech model to use", zh="要使用的文本转语音模型"
+            ),
+            "max_concurrent_tasks": Description(
+                en="Maximum number of sentences synthesized at the same time",
+                zh="同时合成的最大句子数",
+            ),
+            "azure_tts": Description(
+                en="Configuration for Azure TTS", zh="Azure TTS 配置"
+            ),
+            "bark_tts": Description(
+                en="Configuration for Bark TTS", zh="Bark TTS 配置"
+            ),
+            "edge_tts": Description(
+                en="Configuration for Edge TTS", zh="Edge TTS 配置"
+            ),
+            "cosyvoice_tts": Description(
+                en="Configuration for Cosyvoice TTS", zh="Cosyvoice TTS 配置"
+            ),
+            "cosyvoice2_tts": Description(
+                en="Configuration for Cosyvoice2 TTS", zh="Cosyvoice2 TTS 配置"
+            ),
+            "melo_tts": Description(
+                en="Configuration for Melo TTS", zh="Melo TTS 配置"
+            ),
+            "coqui_tts": Description(
+                en="Configuration for Coqui TTS", zh="Coqui TTS 配置"
+            ),
+            "x_tts": Description(en="Configuration for XTTS", zh="XTTS 配置"),
+            "gpt_sovits_tts": Description(
+                en="Configuration for GPT-SoVITS", zh="GPT-SoVITS 配置"
+            ),
+            "fish_api_tts": Description(
+                en="Configuration for Fish API TTS", zh="Fish API TTS 配置"
+            ),
+            "sherpa_onnx_tts": Description(
+                en="Configuration for Sherpa Onnx TTS", zh="Sherpa Onnx TTS 配置"
+            ),
+        }
+    )
 
     @model_validator(mode="after")
     def check_tts_config(cls, values: "TTSConfig", info: ValidationInfo):
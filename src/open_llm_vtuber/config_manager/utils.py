@@ -10,6 +10,11 @@ from loguru import logger
 
 from .main import Config
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -46,7 +51,7 @@ def read_yaml(config_path: str) -> Dict[str, Any]:
     content = pattern.sub(replacer, content)
 
     try:
-        return yaml.safe_load(content)
+        return yaml.load(content, Loader=SafeLoader)
     except yaml.YAMLError as e:
         logger.critical(f"Error parsing YAML file: {e}")
         raise e
@@ -1,18 +1,43 @@
 import asyncio
 import json
+import random
 from typing import Dict, Optional, Callable
 
-import numpy as np
 from fastapi import WebSocket
 from loguru import logger
 
 from ..chat_group import ChatGroupManager
-from ..chat_history_manager import store_message
+from ..chat_history_manager import store_message, store_message_async
 from ..service_context import ServiceContext
-from .group_conversation import process_group_conversation
+from .group_conversation import member_history_keys, process_group_conversation
 from .single_conversation import process_single_conversation
 from .conversation_utils import EMOJI_LIST
-from .types import GroupConversationState
+from .tts_manager import TTSTaskManager
+from .types import AudioBuffer, GroupConversationState
+
+# One TTSTaskManager per client, reused across conversation turns
+_tts_managers: Dict[str, TTSTaskManager] = {}
+
+
+def get_tts_manager(client_uid: str, context: ServiceContext) -> TTSTaskManager:
+    """
+    Get the reusable TTSTaskManager of a client, creating it on first use or
+    when the configured TTS concurrency changed
+    """
+    max_concurrent_tasks = context.character_config.tts_config.max_concurrent_tasks
+    tts_manager = _tts_managers.get(client_uid)
+    if tts_manager is None or tts_manager.max_concurrent_tasks != max_concurrent_tasks:
+        if tts_manager is not None:
+            tts_manager.clear()
+        tts_manager = _tts_managers[client_uid] = TTSTaskManager(max_concurrent_tasks)
+    return tts_manager
+
+
+def release_tts_manager(client_uid: str) -> None:
+    """Drop the TTSTaskManager of a disconnected client"""
+    tts_manager = _tts_managers.pop(client_uid, None)
+    if tts_manager is not None:
+        tts_manager.clear()
 
 
 async def handle_conversation_trigger(
@@ -24,7 +49,7 @@ async def handle_conversation_trigger(
     client_contexts: Dict[str, ServiceContext],
     client_connections: Dict[str, WebSocket],
     chat_group_manager: ChatGroupManager,
-    received_data_buffers: Dict[str, np.ndarray],
+    received_data_buffers: Dict[str, AudioBuffer],
     current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
     broadcast_to_group: Callable,
 ) -> None:
@@ -42,11 +67,10 @@ async def handle_conversation_trigger(
     elif msg_type == "text-input":
         user_input = data.get("text", "")
     else:  # mic-audio-end
-        user_input = received_data_buffers[client_uid]
-        received_data_buffers[client_uid] = np.array([])
+        user_input = received_data_buffers[client_uid].take()
 
     images = data.get("images")
-    session_emoji = np.random.choice(EMOJI_LIST)
+    session_emoji = random.choice(EMOJI_LIST)
 
     group = chat_group_manager.get_client_group(client_uid)
     if group and len(group.members) > 1:
@@ -58,64 +82,103 @@ async def handle_conversation_trigger(
         ):
             logger.info(f"Starting new group conversation for {task_key}")
 
-            current_conversation_tasks[task_key] = asyncio.create_task(
-                process_group_conversation(
-                    client_contexts=client_contexts,
-                    client_connections=client_connections,
-                    broadcast_func=broadcast_to_group,
-                    group_members=group.members,
-                    initiator_client_uid=client_uid,
+            _track_task(
+                current_conversation_tasks,
+                task_key,
+                asyncio.create_task(
+                    process_group_conversation(
+                        client_contexts=client_contexts,
+                        client_connections=client_connections,
+                        broadcast_func=broadcast_to_group,
+                        group_members=group.members,
+                        initiator_client_uid=client_uid,
+                        user_input=user_input,
+                        images=images,
+                        session_emoji=session_emoji,
+                        tts_managers={
+                            uid: get_tts_manager(uid, client_contexts[uid])
+                            for uid in group.members
+                        },
+                    )
+                ),
+            )
+    else:
+        # Use client_uid as task key for individual conversations.
+        # A new turn replaces any turn still running for this client.
+        previous_task = current_conversation_tasks.get(client_uid)
+        if previous_task and not previous_task.done():
+            logger.info(f"Cancelling unfinished conversation for {client_uid}")
+            previous_task.cancel()
+            # Let it finish cleaning up the shared TTSTaskManager first
+            await asyncio.gather(previous_task, return_exceptions=True)
+
+        _track_task(
+            current_conversation_tasks,
+            client_uid,
+            asyncio.create_task(
+                process_single_conversation(
+                    context=context,
+                    websocket_send=websocket.send_text,
+                    client_uid=client_uid,
                     user_input=user_input,
                     images=images,
                     session_emoji=session_emoji,
+                    tts_manager=get_tts_manager(client_uid, context),
                 )
-            )
-    else:
-        # Use client_uid as task key for individual conversations
-        current_conversation_tasks[client_uid] = asyncio.create_task(
-            process_single_conversation(
-                context=context,
-                websocket_send=websocket.send_text,
-                client_uid=client_uid,
-                user_input=user_input,
-                images=images,
-                session_emoji=session_emoji,
-            )
+            ),
         )
 
 
+def _track_task(
+    current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
+    task_key: str,
+    task: asyncio.Task,
+) -> None:
+    """Register a conversation task and drop it from the map once it finishes"""
+    current_conversation_tasks[task_key] = task
+
+    def _forget(finished: asyncio.Task) -> None:
+        # Only remove the entry if a newer task has not replaced it
+        if current_conversation_tasks.get(task_key) is finished:
+            current_conversation_tasks.pop(task_key, None)
+
+    task.add_done_callback(_forget)
+
+
 async def handle_individual_interrupt(
     client_uid: str,
     current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
     context: ServiceContext,
     heard_response: str,
 ):
-    if client_uid in current_conversation_tasks:
-        task = current_conversation_tasks[client_uid]
-        if task and not task.done():
-            task.cancel()
-            logger.info("🛑 Conversation task was successfully interrupted")
-
-        try:
-            context.agent_engine.handle_interrupt(heard_response)
-        except Exception as e:
-            logger.error(f"Error handling interrupt: {e}")
-
-        if context.history_uid:
-            store_message(
-                conf_uid=context.character_config.conf_uid,
-                history_uid=context.history_uid,
-                role="ai",
-                content=heard_response,
-                name=context.character_config.character_name,
-                avatar=context.character_config.avatar,
-            )
-            store_message(
-                conf_uid=context.character_config.conf_uid,
-                history_uid=context.history_uid,
-                role="system",
-                content="[Interrupted by user]",
-            )
+    # Finished turns are dropped from current_conversation_tasks, but the
+    # frontend may still be playing their audio, so the interrupt is always
+    # recorded; only cancelling depends on a task still running
+    task = current_conversation_tasks.get(client_uid)
+    if task and not task.done():
+        task.cancel()
+        logger.info("🛑 Conversation task was successfully interrupted")
+
+    try:
+        context.agent_engine.handle_interrupt(heard_response)
+    except Exception as e:
+        logger.error(f"Error handling interrupt: {e}")
+
+    if context.history_uid:
+        store_message(
+            conf_uid=context.character_config.conf_uid,
+            history_uid=context.history_uid,
+            role="ai",
+            content=heard_response,
+            name=context.character_config.character_name,
+            avatar=context.character_config.avatar,
+        )
+        store_message(
+            conf_uid=context.character_config.conf_uid,
+            history_uid=context.history_uid,
+            role="system",
+            content="[Interrupted by user]",
+        )
 
 
 async def handle_group_interrupt(
@@ -157,27 +220,47 @@ async def handle_group_interrupt(
 
     # Store messages with speaker info
     if context and group:
-        for member_uid in group.members:
-            if member_uid in client_contexts:
-                try:
-                    member_ctx = client_contexts[member_uid]
-                    member_ctx.agent_engine.handle_interrupt(heard_response)
-                    store_message(
-                        conf_uid=member_ctx.character_config.conf_uid,
-                        history_uid=member_ctx.history_uid,
-                        role="ai",
-                        content=heard_response,
-                        name=context.character_config.character_name,
-                        avatar=context.character_config.avatar,
-                    )
-                    store_message(
-                        conf_uid=member_ctx.character_config.conf_uid,
-                        history_uid=member_ctx.history_uid,
-                        role="system",
-                        content="[Interrupted by user]",
-                    )
-                except Exception as e:
-                    logger.error(f"Error handling interrupt for {member_uid}: {e}")
+        speaker_name = context.character_config.character_name
+        speaker_avatar = context.character_config.avatar
+
+        member_uids = [uid for uid in group.members if uid in client_contexts]
+        for member_uid in member_uids:
+            try:
+                client_contexts[member_uid].agent_engine.handle_interrupt(
+                    heard_response
+                )
+            except Exception as e:
+                logger.error(f"Error handling interrupt for {member_uid}: {e}")
+
+        async def store_interrupt(conf_uid: str, history_uid: str) -> None:
+            try:
+                # Both messages go to the same history file, so keep them ordered
+                await store_message_async(
+                    conf_uid=conf_uid,
+                    history_uid=history_uid,
+                    role="ai",
+                    content=heard_response,
+                    name=speaker_name,
+                    avatar=speaker_avatar,
+                )
+                await store_message_async(
+                    conf_uid=conf_uid,
+                    history_uid=history_uid,
+                    role="system",
+                    content="[Interrupted by user]",
+                )
+            except Exception as e:
+                logger.error(f"Error storing interrupt in {history_uid}: {e}")
+
+        # One write sequence per history file; members can share a history
+        await asyncio.gather(
+            *(
+                store_interrupt(conf_uid, history_uid)
+                for conf_uid, history_uid in member_history_keys(
+                    client_contexts, member_uids
+                )
+            )
+        )
 
     await broadcast_to_group(
         list(group.members),
@@ -1,12 +1,10 @@
-import asyncio
 import re
 from typing import Optional, Union, Any, List, Dict
-import numpy as np
 import json
 from loguru import logger
 
 from ..message_handler import message_handler
-from .types import WebSocketSend, BroadcastContext
+from .types import AudioArray, WebSocketSend, BroadcastContext
 from .tts_manager import TTSTaskManager
 from ..agent.output_types import SentenceOutput, AudioOutput
 from ..agent.input_types import BatchInput, TextData, ImageData, TextSource, ImageSource
@@ -14,6 +12,18 @@ from ..asr.asr_interface import ASRInterface
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
 from ..utils.stream_audio import prepare_audio_payload
+from ..utils.json_utils import dumps
+
+# Static control messages, encoded once. Both websocket sends and broadcast
+# funcs accept these pre-serialized strings.
+CHAIN_START_JSON = json.dumps({"type": "control", "text": "conversation-chain-start"})
+CHAIN_END_JSON = json.dumps({"type": "control", "text": "conversation-chain-end"})
+THINKING_JSON = json.dumps({"type": "full-text", "text": "Thinking..."})
+FORCE_NEW_MESSAGE_JSON = json.dumps({"type": "force-new-message"})
+BACKEND_SYNTH_COMPLETE_JSON = json.dumps({"type": "backend-synth-complete"})
+
+# Any character that is not whitespace or punctuation, i.e. worth translating
+_MEANINGFUL_CHAR_RE = re.compile(r'[^\s.,!?，。！？\'"』」）】]')
 
 
 # Convert class methods to standalone functions
@@ -23,20 +33,19 @@ def create_batch_input(
     from_name: str,
 ) -> BatchInput:
     """Create batch input for agent processing"""
+    texts = [TextData(source=TextSource.INPUT, content=input_text, from_name=from_name)]
+    if not images:
+        return BatchInput(texts=texts, images=None)
     return BatchInput(
-        texts=[
-            TextData(source=TextSource.INPUT, content=input_text, from_name=from_name)
-        ],
+        texts=texts,
         images=[
             ImageData(
                 source=ImageSource(img["source"]),
                 data=img["data"],
                 mime_type=img["mime_type"],
             )
-            for img in (images or [])
-        ]
-        if images
-        else None,
+            for img in images
+        ],
     )
 
 
@@ -88,18 +97,18 @@ async def handle_sentence_output(
     translate_engine: Optional[Any] = None,
 ) -> str:
     """Handle sentence output type with optional translation support"""
-    full_response = ""
+    response_parts: List[str] = []
     async for display_text, tts_text, actions in output:
         logger.debug(f"🏃 Processing output: '''{tts_text}'''...")
 
         if translate_engine:
-            if len(re.sub(r'[\s.,!?，。！？\'"』」）】\s]+', "", tts_text)):
-                tts_text = translate_engine.translate(tts_text)
+            if _MEANINGFUL_CHAR_RE.search(tts_text):
+                tts_text = await translate_engine.async_translate(tts_text)
             logger.info(f"🏃 Text after translation: '''{tts_text}'''...")
         else:
             logger.debug("🚫 No translation engine available. Skipping translation.")
 
-        full_response += display_text.text
+        response_parts.append(display_text.text)
         await tts_manager.speak(
             tts_text=tts_text,
             display_text=display_text,
@@ -108,7 +117,7 @@ async def handle_sentence_output(
             tts_engine=tts_engine,
             websocket_send=websocket_send,
         )
-    return full_response
+    return "".join(response_parts)
 
 
 async def handle_audio_output(
@@ -116,38 +125,31 @@ async def handle_audio_output(
     websocket_send: WebSocketSend,
 ) -> str:
     """Process and send AudioOutput directly to the client"""
-    full_response = ""
+    response_parts: List[str] = []
     async for audio_path, display_text, transcript, actions in output:
-        full_response += transcript
+        response_parts.append(transcript)
         audio_payload = prepare_audio_payload(
             audio_path=audio_path,
             display_text=display_text,
             actions=actions.to_dict() if actions else None,
         )
-        await websocket_send(json.dumps(audio_payload))
-    return full_response
+        await websocket_send(dumps(audio_payload))
+    return "".join(response_parts)
 
 
 async def send_conversation_start_signals(websocket_send: WebSocketSend) -> None:
     """Send initial conversation signals"""
-    await websocket_send(
-        json.dumps(
-            {
-                "type": "control",
-                "text": "conversation-chain-start",
-            }
-        )
-    )
-    await websocket_send(json.dumps({"type": "full-text", "text": "Thinking..."}))
+    await websocket_send(CHAIN_START_JSON)
+    await websocket_send(THINKING_JSON)
 
 
 async def process_user_input(
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, AudioArray],
     asr_engine: ASRInterface,
     websocket_send: WebSocketSend,
 ) -> str:
     """Process user input, converting audio to text if needed"""
-    if isinstance(user_input, np.ndarray):
+    if not isinstance(user_input, str):
         logger.info("Transcribing audio input...")
         input_text = await asr_engine.async_transcribe_np(user_input)
         await websocket_send(
@@ -164,9 +166,11 @@ async def finalize_conversation_turn(
     broadcast_ctx: Optional[BroadcastContext] = None,
 ) -> None:
     """Finalize a conversation turn"""
-    if tts_manager.task_list:
-        await asyncio.gather(*tts_manager.task_list)
-        await websocket_send(json.dumps({"type": "backend-synth-complete"}))
+    if tts_manager.tasks_queued:
+        await tts_manager.wait_for_tasks()
+        # Drained, so calling finalize again does not resend the signal
+        tts_manager.tasks_queued = 0
+        await websocket_send(BACKEND_SYNTH_COMPLETE_JSON)
 
         response = await message_handler.wait_for_response(
             client_uid, "frontend-playback-complete"
@@ -176,12 +180,12 @@ async def finalize_conversation_turn(
             logger.warning(f"No playback completion response from {client_uid}")
             return
 
-    await websocket_send(json.dumps({"type": "force-new-message"}))
+    await websocket_send(FORCE_NEW_MESSAGE_JSON)
 
     if broadcast_ctx and broadcast_ctx.broadcast_func:
         await broadcast_ctx.broadcast_func(
             broadcast_ctx.group_members,
-            {"type": "force-new-message"},
+            FORCE_NEW_MESSAGE_JSON,
             broadcast_ctx.current_client_uid,
         )
 
@@ -194,17 +198,12 @@ async def send_conversation_end_signal(
     session_emoji: str = "😊",
 ) -> None:
     """Send conversation chain end signal"""
-    chain_end_msg = {
-        "type": "control",
-        "text": "conversation-chain-end",
-    }
-
-    await websocket_send(json.dumps(chain_end_msg))
+    await websocket_send(CHAIN_END_JSON)
 
     if broadcast_ctx and broadcast_ctx.broadcast_func and broadcast_ctx.group_members:
         await broadcast_ctx.broadcast_func(
             broadcast_ctx.group_members,
-            chain_end_msg,
+            CHAIN_END_JSON,
         )
 
     logger.info(f"😎👍✅ Conversation Chain {session_emoji} completed!")
@@ -216,7 +215,7 @@ def cleanup_conversation(tts_manager: TTSTaskManager, session_emoji: str) -> Non
     logger.debug(f"🧹 Clearing up conversation {session_emoji}.")
 
 
-EMOJI_LIST = [
+EMOJI_LIST = (
     "🐶",
     "🐱",
     "🐭",
@@ -271,7 +270,6 @@ EMOJI_LIST = [
     "🌩",
     "⛄️",
     "🎃",
-    "🎄",
     "🎉",
     "🎏",
     "🎗",
@@ -288,4 +286,4 @@ EMOJI_LIST = [
     "👕",
     "👜",
     "👑",
-]
+)
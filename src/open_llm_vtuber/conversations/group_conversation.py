@@ -1,9 +1,9 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import asyncio
-import json
+import random
+from collections import deque
 from loguru import logger
 from fastapi import WebSocket
-import numpy as np
 
 from .conversation_utils import (
     create_batch_input,
@@ -12,15 +12,18 @@ from .conversation_utils import (
     finalize_conversation_turn,
     cleanup_conversation,
     EMOJI_LIST,
+    CHAIN_START_JSON,
+    THINKING_JSON,
 )
 from .types import (
+    AudioArray,
     BroadcastFunc,
     GroupConversationState,
     BroadcastContext,
     WebSocketSend,
 )
 from ..service_context import ServiceContext
-from ..chat_history_manager import store_message
+from ..chat_history_manager import store_message_async
 from .tts_manager import TTSTaskManager
 
 
@@ -30,9 +33,10 @@ async def process_group_conversation(
     broadcast_func: BroadcastFunc,
     group_members: List[str],
     initiator_client_uid: str,
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, AudioArray],
     images: Optional[List[Dict[str, Any]]] = None,
-    session_emoji: str = np.random.choice(EMOJI_LIST),
+    session_emoji: Optional[str] = None,
+    tts_managers: Optional[Dict[str, TTSTaskManager]] = None,
 ) -> None:
     """Process group conversation
 
@@ -45,9 +49,17 @@ async def process_group_conversation(
         user_input: Text or audio input from user
         images: Optional list of image data
         session_emoji: Emoji identifier for the conversation
+        tts_managers: Reused TTSTaskManager of each member, new ones if None
     """
-    # Create TTSTaskManager for each member
-    tts_managers = {uid: TTSTaskManager() for uid in group_members}
+    if session_emoji is None:
+        session_emoji = random.choice(EMOJI_LIST)
+
+    # Use a TTSTaskManager for each member
+    if tts_managers is None:
+        tts_managers = {uid: TTSTaskManager() for uid in group_members}
+    else:
+        for tts_manager in tts_managers.values():
+            tts_manager.reset()
 
     try:
         logger.info(f"Group Conversation Chain {session_emoji} started!")
@@ -57,9 +69,9 @@ async def process_group_conversation(
             group_id=f"group_{initiator_client_uid}",  # Use same format as chat_group
             session_emoji=session_emoji,
             group_queue=list(group_members),
-            memory_index={
-                uid: 0 for uid in group_members
-            },  # Initialize memory index for each member
+            pending={
+                uid: deque() for uid in group_members
+            },  # Initialize unread messages for each member
         )
 
         # Initialize group conversation context for each AI
@@ -83,17 +95,22 @@ async def process_group_conversation(
             initiator_client_uid=initiator_client_uid,
         )
 
-        for member_uid in group_members:
-            member_context = client_contexts[member_uid]
-            store_message(
-                conf_uid=member_context.character_config.conf_uid,
-                history_uid=member_context.history_uid,
-                role="human",
-                content=input_text,
-                name=human_name,
+        await asyncio.gather(
+            *(
+                store_message_async(
+                    conf_uid=conf_uid,
+                    history_uid=history_uid,
+                    role="human",
+                    content=input_text,
+                    name=human_name,
+                )
+                for conf_uid, history_uid in member_history_keys(
+                    client_contexts, group_members
+                )
             )
+        )
 
-        state.conversation_history = [f"{human_name}: {input_text}"]
+        state.add_message(f"{human_name}: {input_text}")
 
         # Main conversation loop
         while state.group_queue:
@@ -134,13 +151,30 @@ async def process_group_conversation(
         GroupConversationState.remove_state(state.group_id)
 
 
+def member_history_keys(
+    client_contexts: Dict[str, ServiceContext], group_members: List[str]
+) -> List[Tuple[str, str]]:
+    """
+    Collect the distinct (conf_uid, history_uid) pairs of the group members.
+
+    Members that loaded the same history share one pair, so writes gathered
+    over the result never touch the same history file concurrently.
+    """
+    return list(
+        dict.fromkeys(
+            (ctx.character_config.conf_uid, ctx.history_uid)
+            for ctx in (client_contexts[uid] for uid in group_members)
+        )
+    )
+
+
 def init_group_conversation_state(
     group_members: List[str], session_emoji: str
 ) -> GroupConversationState:
     """Initialize group conversation state"""
     return GroupConversationState(
         conversation_history=[],
-        memory_index={uid: 0 for uid in group_members},
+        pending={uid: deque() for uid in group_members},
         group_queue=list(group_members),
         session_emoji=session_emoji,
     )
@@ -170,7 +204,7 @@ def init_group_conversation_contexts(
 
 
 async def process_group_input(
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, AudioArray],
     initiator_context: ServiceContext,
     initiator_ws_send: WebSocketSend,
     broadcast_func: BroadcastFunc,
@@ -223,8 +257,7 @@ async def handle_group_member_turn(
     context = client_contexts[current_member_uid]
     current_ws_send = client_connections[current_member_uid].send_text
 
-    new_messages = state.conversation_history[state.memory_index[current_member_uid] :]
-    new_context = "\n".join(new_messages) if new_messages else ""
+    new_context = "\n".join(state.take_pending(current_member_uid))
 
     batch_input = create_batch_input(
         input_text=new_context, images=images, from_name="Human"
@@ -242,10 +275,7 @@ async def handle_group_member_turn(
         tts_manager=tts_manager,
     )
 
-    if tts_manager.task_list:
-        await asyncio.gather(*tts_manager.task_list)
-        await current_ws_send(json.dumps({"type": "backend-synth-complete"}))
-
+    if tts_manager.tasks_queued:
         broadcast_ctx = BroadcastContext(
             broadcast_func=broadcast_func,
             group_members=group_members,
@@ -261,21 +291,27 @@ async def handle_group_member_turn(
 
     if full_response:
         ai_message = f"{context.character_config.character_name}: {full_response}"
-        state.conversation_history.append(ai_message)
+        state.add_message(ai_message, exclude_uid=current_member_uid)
         logger.info(f"Appended complete response: {ai_message}")
 
-        for member_uid in group_members:
-            member_context = client_contexts[member_uid]
-            store_message(
-                conf_uid=member_context.character_config.conf_uid,
-                history_uid=member_context.history_uid,
-                role="ai",
-                content=full_response,
-                name=context.character_config.character_name,
-                avatar=context.character_config.avatar,
+        character_config = context.character_config
+        ai_name, ai_avatar = character_config.character_name, character_config.avatar
+        await asyncio.gather(
+            *(
+                store_message_async(
+                    conf_uid=conf_uid,
+                    history_uid=history_uid,
+                    role="ai",
+                    content=full_response,
+                    name=ai_name,
+                    avatar=ai_avatar,
+                )
+                for conf_uid, history_uid in member_history_keys(
+                    client_contexts, group_members
+                )
             )
+        )
 
-    state.memory_index[current_member_uid] = len(state.conversation_history)
     state.group_queue.append(current_member_uid)
 
     # Clear speaker after turn completes
@@ -286,14 +322,8 @@ async def broadcast_thinking_state(
     broadcast_func: BroadcastFunc, group_members: List[str]
 ) -> None:
     """Broadcast thinking state to group"""
-    await broadcast_func(
-        group_members,
-        {"type": "control", "text": "conversation-chain-start"},
-    )
-    await broadcast_func(
-        group_members,
-        {"type": "full-text", "text": "Thinking..."},
-    )
+    await broadcast_func(group_members, CHAIN_START_JSON)
+    await broadcast_func(group_members, THINKING_JSON)
 
 
 async def handle_member_error(
@@ -318,7 +348,7 @@ async def process_member_response(
     tts_manager: TTSTaskManager,
 ) -> str:
     """Process group member's response"""
-    full_response = ""
+    response_parts: List[str] = []
 
     try:
         agent_output = context.agent_engine.chat(batch_input)
@@ -333,10 +363,10 @@ async def process_member_response(
                 tts_manager=tts_manager,
                 translate_engine=context.translate_engine,
             )
-            full_response += response_part
+            response_parts.append(response_part)
 
     except Exception as e:
         logger.error(f"Error processing member response: {e}")
         raise
 
-    return full_response
+    return "".join(response_parts)
@@ -1,8 +1,8 @@
 from typing import Union, List, Dict, Any, Optional
 import asyncio
+import random
 import json
 from loguru import logger
-import numpy as np
 
 from .conversation_utils import (
     create_batch_input,
@@ -13,7 +13,7 @@ from .conversation_utils import (
     cleanup_conversation,
     EMOJI_LIST,
 )
-from .types import WebSocketSend
+from .types import AudioArray, WebSocketSend
 from .tts_manager import TTSTaskManager
 from ..chat_history_manager import store_message
 from ..service_context import ServiceContext
@@ -23,9 +23,10 @@ async def process_single_conversation(
     context: ServiceContext,
     websocket_send: WebSocketSend,
     client_uid: str,
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, AudioArray],
     images: Optional[List[Dict[str, Any]]] = None,
-    session_emoji: str = np.random.choice(EMOJI_LIST),
+    session_emoji: Optional[str] = None,
+    tts_manager: Optional[TTSTaskManager] = None,
 ) -> str:
     """Process a single-user conversation turn
 
@@ -36,12 +37,18 @@ async def process_single_conversation(
         user_input: Text or audio input from user
         images: Optional list of image data
         session_emoji: Emoji identifier for the conversation
+        tts_manager: Reused TTSTaskManager of the client, a new one if None
 
     Returns:
         str: Complete response text
     """
-    # Create TTSTaskManager for this conversation
-    tts_manager = TTSTaskManager()
+    if session_emoji is None:
+        session_emoji = random.choice(EMOJI_LIST)
+
+    if tts_manager is None:
+        tts_manager = TTSTaskManager()
+    else:
+        tts_manager.reset()
 
     try:
         # Send initial signals
@@ -81,11 +88,7 @@ async def process_single_conversation(
             tts_manager=tts_manager,
         )
 
-        # Wait for any pending TTS tasks
-        if tts_manager.task_list:
-            await asyncio.gather(*tts_manager.task_list)
-            await websocket_send(json.dumps({"type": "backend-synth-complete"}))
-
+        # Waits for pending TTS tasks and signals backend-synth-complete
         await finalize_conversation_turn(
             tts_manager=tts_manager,
             websocket_send=websocket_send,
@@ -135,7 +138,7 @@ async def process_agent_response(
     Returns:
         str: The complete response text
     """
-    full_response = ""
+    response_parts: List[str] = []
     try:
         agent_output = context.agent_engine.chat(batch_input)
         async for output in agent_output:
@@ -148,10 +151,10 @@ async def process_agent_response(
                 tts_manager=tts_manager,
                 translate_engine=context.translate_engine,
             )
-            full_response += response_part
+            response_parts.append(response_part)
 
     except Exception as e:
         logger.error(f"Error processing agent response: {e}")
         raise
 
-    return full_response
+    return "".join(response_parts)
@@ -1,31 +1,48 @@
 import asyncio
-import json
 import re
-import uuid
-from datetime import datetime
-from typing import List, Optional, Dict
+import heapq
+from typing import List, Optional, Dict, Set, Tuple
 from loguru import logger
 
 from ..agent.output_types import DisplayText, Actions
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
 from ..utils.stream_audio import prepare_audio_payload
+from ..utils.json_utils import dumps
 from .types import WebSocketSend
 
+# Any character that is not whitespace or punctuation, i.e. worth speaking
+_NONEMPTY_RE = re.compile(r'[^\s.,!?，。！？\'"』」）】]')
+
 
 class TTSTaskManager:
     """Manages TTS tasks and ensures ordered delivery to frontend while allowing parallel TTS generation"""
 
-    def __init__(self) -> None:
-        self.task_list: List[asyncio.Task] = []
-        self._lock = asyncio.Lock()
-        # Queue to store ordered payloads
-        self._payload_queue: asyncio.Queue[Dict] = asyncio.Queue()
+    def __init__(self, max_concurrent_tasks: int = 3) -> None:
+        # Running TTS tasks; each one removes itself when it finishes
+        self.task_list: Set[asyncio.Task] = set()
+        # TTS tasks queued since the turn was last finalized, including
+        # finished ones, so the turn knows it has audio to wait for
+        self.tasks_queued = 0
+        # Bounds how many sentences are synthesized at once, so a fast LLM
+        # does not start a TTS task for every sentence of a long reply
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self._tts_sem = asyncio.Semaphore(max_concurrent_tasks)
+        # Min-heap of (sequence_number, sub_sequence, is_last, payload) waiting
+        # for ordered delivery. A sentence is streamed as one or more chunks;
+        # is_last marks its final chunk, whose payload may be None.
+        self._payload_heap: List[Tuple[int, int, bool, Optional[Dict]]] = []
+        # Set whenever a payload is pushed, wakes the sender task
+        self._payload_ready = asyncio.Event()
         # Task to handle sending payloads in order
         self._sender_task: Optional[asyncio.Task] = None
         # Counter for maintaining order
         self._sequence_counter = 0
         self._next_sequence_to_send = 0
+        self._next_sub_sequence_to_send = 0
+        # Bumped by clear(), so payloads of tasks from an earlier turn that
+        # are still unwinding are dropped instead of reusing sequence numbers
+        self._generation = 0
 
     async def speak(
         self,
@@ -47,7 +64,7 @@ class TTSTaskManager:
             tts_engine: TTS engine instance
             websocket_send: WebSocket send function
         """
-        if len(re.sub(r'[\s.,!?，。！？\'"』」）】\s]+', "", tts_text)) == 0:
+        if _NONEMPTY_RE.search(tts_text) is None:
             logger.debug("Empty TTS text, sending silent display payload")
             # Get current sequence number for silent payload
             current_sequence = self._sequence_counter
@@ -59,7 +76,9 @@ class TTSTaskManager:
                     self._process_payload_queue(websocket_send)
                 )
 
-            await self._send_silent_payload(display_text, actions, current_sequence)
+            await self._send_silent_payload(
+                display_text, actions, current_sequence, self._generation
+            )
             return
 
         logger.debug(
@@ -85,39 +104,74 @@ class TTSTaskManager:
                 live2d_model=live2d_model,
                 tts_engine=tts_engine,
                 sequence_number=current_sequence,
+                generation=self._generation,
             )
         )
-        self.task_list.append(task)
+        self.task_list.add(task)
+        task.add_done_callback(self.task_list.discard)
+        self.tasks_queued += 1
 
     async def _process_payload_queue(self, websocket_send: WebSocketSend) -> None:
         """
         Process and send payloads in correct order.
         Runs continuously until all payloads are processed.
         """
-        buffered_payloads: Dict[int, Dict] = {}
-
         while True:
             try:
-                # Get payload from queue
-                payload, sequence_number = await self._payload_queue.get()
-                buffered_payloads[sequence_number] = payload
+                await self._payload_ready.wait()
+                self._payload_ready.clear()
 
-                # Send payloads in order
-                while self._next_sequence_to_send in buffered_payloads:
-                    next_payload = buffered_payloads.pop(self._next_sequence_to_send)
-                    await websocket_send(json.dumps(next_payload))
-                    self._next_sequence_to_send += 1
+                # Collect every payload that is now ready to go out in order.
+                # Chunks of the sentence at the head of the line go out as soon
+                # as they arrive; later sentences wait in the heap.
+                batch = []
+                while self._payload_heap and self._payload_heap[0][:2] == (
+                    self._next_sequence_to_send,
+                    self._next_sub_sequence_to_send,
+                ):
+                    _, _, is_last, payload = heapq.heappop(self._payload_heap)
+                    if is_last:
+                        self._next_sequence_to_send += 1
+                        self._next_sub_sequence_to_send = 0
+                    else:
+                        self._next_sub_sequence_to_send += 1
+                    if payload is not None:
+                        batch.append(payload)
 
-                self._payload_queue.task_done()
+                # The frontend takes one audio payload per frame, so the batch
+                # is sent back-to-back rather than wrapped in a single frame.
+                # Each send only waits for the transport when its write buffer
+                # is above the high-water mark, so awaiting it per payload adds
+                # no loop turnaround while the socket keeps up.
+                for next_payload in batch:
+                    await websocket_send(dumps(next_payload))
 
             except asyncio.CancelledError:
                 break
 
+    def _push_payload(
+        self,
+        payload: Optional[Dict],
+        sequence_number: int,
+        generation: int,
+        sub_sequence: int = 0,
+        is_last: bool = True,
+    ) -> None:
+        """Hand a payload to the sender task for ordered delivery"""
+        if generation != self._generation:
+            # Left over from a turn that was cleared
+            return
+        heapq.heappush(
+            self._payload_heap, (sequence_number, sub_sequence, is_last, payload)
+        )
+        self._payload_ready.set()
+
     async def _send_silent_payload(
         self,
         display_text: DisplayText,
         actions: Optional[Actions],
         sequence_number: int,
+        generation: int,
     ) -> None:
         """Queue a silent audio payload"""
         audio_payload = prepare_audio_payload(
@@ -125,7 +179,7 @@ class TTSTaskManager:
             display_text=display_text,
             actions=actions,
         )
-        await self._payload_queue.put((audio_payload, sequence_number))
+        self._push_payload(audio_payload, sequence_number, generation)
 
     async def _process_tts(
         self,
@@ -135,48 +189,89 @@ class TTSTaskManager:
         live2d_model: Live2dModel,
         tts_engine: TTSInterface,
         sequence_number: int,
+        generation: int,
     ) -> None:
-        """Process TTS generation and queue the result for ordered delivery"""
-        audio_file_path = None
-        try:
-            audio_file_path = await self._generate_audio(tts_engine, tts_text)
-            payload = prepare_audio_payload(
-                audio_path=audio_file_path,
-                display_text=display_text,
-                actions=actions,
-            )
-            # Queue the payload with its sequence number
-            await self._payload_queue.put((payload, sequence_number))
-
-        except Exception as e:
-            logger.error(f"Error preparing audio payload: {e}")
-            # Queue silent payload for error case
-            payload = prepare_audio_payload(
-                audio_path=None,
-                display_text=display_text,
-                actions=actions,
-            )
-            await self._payload_queue.put((payload, sequence_number))
-
-        finally:
-            if audio_file_path:
-                tts_engine.remove_file(audio_file_path)
-                logger.debug("Audio cache file cleaned.")
-
-    async def _generate_audio(self, tts_engine: TTSInterface, text: str) -> str:
-        """Generate audio file from text"""
-        logger.debug(f"🏃Generating audio for '''{text}'''...")
-        return await tts_engine.async_generate_audio(
-            text=text,
-            file_name_no_ext=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
-        )
+        """
+        Process TTS generation and queue each audio chunk for ordered delivery.
+
+        Only the first chunk carries the display text and actions, so a
+        streamed sentence is shown and animated once.
+        """
+        async with self._tts_sem:
+            sub_sequence = 0
+            try:
+                logger.debug(f"🏃Generating audio for '''{tts_text}'''...")
+                async for audio_bytes in tts_engine.async_stream_audio(tts_text):
+                    first = sub_sequence == 0
+                    payload = prepare_audio_payload(
+                        audio_path=None,
+                        audio_bytes=audio_bytes,
+                        display_text=display_text if first else None,
+                        actions=actions if first else None,
+                    )
+                    self._push_payload(
+                        payload,
+                        sequence_number,
+                        generation,
+                        sub_sequence,
+                        is_last=False,
+                    )
+                    sub_sequence += 1
+
+                if sub_sequence == 0:
+                    # No audio was generated, show the text silently
+                    await self._send_silent_payload(
+                        display_text, actions, sequence_number, generation
+                    )
+                else:
+                    # Close the sentence so the sender moves on to the next one
+                    self._push_payload(None, sequence_number, generation, sub_sequence)
+
+            except Exception as e:
+                logger.error(f"Error preparing audio payload: {e}")
+                if sub_sequence == 0:
+                    # Queue silent payload for error case
+                    await self._send_silent_payload(
+                        display_text, actions, sequence_number, generation
+                    )
+                else:
+                    # Close the sentence after the chunks already queued
+                    self._push_payload(None, sequence_number, generation, sub_sequence)
+
+    async def wait_for_tasks(self) -> None:
+        """
+        Wait for all queued TTS tasks.
+
+        A task never fails on a synthesis error, which _process_tts turns into
+        a silent payload. If the caller is cancelled, gather cancels the TTS
+        tasks as well.
+        """
+        if self.task_list:
+            await asyncio.gather(*self.task_list)
+
+    def reset(self) -> None:
+        """Prepare a reused manager for a new conversation turn"""
+        self.clear()
 
     def clear(self) -> None:
-        """Clear all pending tasks and reset state"""
+        """
+        Cancel all pending tasks and reset state.
+
+        Cancelled tasks may still be unwinding when the next turn starts, so
+        they get a fresh semaphore and generation: they neither hold back the
+        new turn's TTS tasks nor deliver their payloads to it.
+        """
+        for task in self.task_list:
+            task.cancel()
         self.task_list.clear()
+        self.tasks_queued = 0
+        self._tts_sem = asyncio.Semaphore(self.max_concurrent_tasks)
+        self._generation += 1
         if self._sender_task:
             self._sender_task.cancel()
         self._sequence_counter = 0
         self._next_sequence_to_send = 0
-        # Create a new queue to clear any pending items
-        self._payload_queue = asyncio.Queue()
+        self._next_sub_sequence_to_send = 0
+        # Drop any payloads that were not sent yet
+        self._payload_heap.clear()
+        self._payload_ready.clear()
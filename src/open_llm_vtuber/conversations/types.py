@@ -1,12 +1,83 @@
-from typing import List, Dict, Callable, Optional, TypedDict, Awaitable, ClassVar
+from typing import List, Dict, Callable, Deque, Optional, TypedDict, Awaitable, ClassVar
+from collections import deque
 from dataclasses import dataclass, field
 from pydantic import BaseModel
+import numpy as np
+from loguru import logger
 
 from ..agent.output_types import Actions, DisplayText
 
 # Type definitions
+# Buffered microphone audio handed from the websocket handler to ASR
+AudioArray = np.ndarray
+# Sends one JSON text frame (a bound WebSocket.send_text). Frames stay text:
+# the frontend parses event.data as a JSON string and does not handle binary
+# frames, so send_bytes would need a coordinated client change
 WebSocketSend = Callable[[str], Awaitable[None]]
-BroadcastFunc = Callable[[List[str], dict, Optional[str]], Awaitable[None]]
+# Broadcast messages are dicts, or str payloads that are already JSON-encoded
+BroadcastFunc = Callable[[List[str], dict | str, Optional[str]], Awaitable[None]]
+
+
+# Shared read-only empty audio buffer, the input of a turn started without
+# any buffered microphone audio
+EMPTY_AUDIO: AudioArray = np.empty(0, dtype=np.float32)
+EMPTY_AUDIO.setflags(write=False)
+
+# Microphone audio kept per client while waiting for a conversation to start,
+# 30 seconds at 16 kHz
+MAX_BUFFERED_SAMPLES = 30 * 16000
+
+
+@dataclass
+class AudioBuffer:
+    """
+    Microphone audio received so far, one array per websocket message.
+
+    Chunks are float32 samples in [-1, 1) or int16 PCM as received. Appending
+    is O(1); take() converts and concatenates them once when a conversation
+    starts. Only the newest max_samples samples (MAX_BUFFERED_SAMPLES, 30
+    seconds at 16 kHz, by default) are kept, dropping whole chunks from the
+    front; a warning is logged the first time an utterance hits the cap.
+    """
+
+    max_samples: int = MAX_BUFFERED_SAMPLES
+    chunks: Deque[np.ndarray] = field(default_factory=deque)
+    num_samples: int = 0
+    capped: bool = False
+
+    def append(self, chunk: np.ndarray) -> None:
+        """Buffer a float32 or int16 chunk, dropping the oldest over the cap"""
+        if not chunk.size:
+            return
+        self.chunks.append(chunk)
+        self.num_samples += chunk.size
+        if self.num_samples > self.max_samples and not self.capped:
+            self.capped = True
+            logger.warning(
+                f"Buffered audio exceeds {self.max_samples} samples, "
+                "dropping the oldest audio of this utterance"
+            )
+        # The newest chunk is always kept, even if it alone exceeds the cap
+        while self.num_samples > self.max_samples and len(self.chunks) > 1:
+            self.num_samples -= self.chunks.popleft().size
+
+    def take(self) -> AudioArray:
+        """Return the buffered audio as float32 samples and empty the buffer"""
+        if not self.chunks:
+            return EMPTY_AUDIO
+        audio = np.empty(self.num_samples, dtype=np.float32)
+        start = 0
+        for chunk in self.chunks:
+            end = start + chunk.size
+            if chunk.dtype.kind == "i":
+                np.multiply(chunk, np.float32(1 / 32768), out=audio[start:end])
+            else:
+                audio[start:end] = chunk
+            start = end
+        self.chunks.clear()
+        self.num_samples = 0
+        self.capped = False
+        return audio
 
 
 class AudioPayload(TypedDict):
@@ -48,11 +119,26 @@ class GroupConversationState:
 
     group_id: str
     conversation_history: List[str] = field(default_factory=list)
-    memory_index: Dict[str, int] = field(default_factory=dict)
+    # Messages each member has not seen yet, consumed at the start of its turn
+    pending: Dict[str, Deque[str]] = field(default_factory=dict)
     group_queue: List[str] = field(default_factory=list)
     session_emoji: str = ""
     current_speaker_uid: Optional[str] = None
 
+    def add_message(self, message: str, exclude_uid: Optional[str] = None) -> None:
+        """Append a message to the history and to every member's unread queue"""
+        self.conversation_history.append(message)
+        for uid, unread in self.pending.items():
+            if uid != exclude_uid:
+                unread.append(message)
+
+    def take_pending(self, uid: str) -> List[str]:
+        """Return and clear the messages a member has not seen yet"""
+        unread = self.pending.setdefault(uid, deque())
+        messages = list(unread)
+        unread.clear()
+        return messages
+
     def __post_init__(self):
         """Register state instance after initialization"""
         GroupConversationState._states[self.group_id] = self
@@ -2,6 +2,8 @@ import json
 import chardet
 from loguru import logger
 
+from .utils.json_utils import dumps
+
 # This class will only prepare the payload for the live2d model
 # the process of sending the payload should be done by the caller
 # This class is **Not responsible** for sending the payload to the server
@@ -15,6 +17,7 @@ class Live2dModel:
         model_dict_path (str): The path to the model dictionary file.
         live2d_model_name (str): The name of the Live2D model.
         model_info (dict): The information of the Live2D model.
+        model_info_json (str): model_info encoded as JSON, shared by every session sending it.
         emo_map (dict): The emotion map of the Live2D model.
         emo_str (str): The string representation of the emotion map of the Live2D model.
     """
@@ -22,6 +25,7 @@ class Live2dModel:
     model_dict_path: str
     live2d_model_name: str
     model_info: dict
+    model_info_json: str
     emo_map: dict
     emo_str: str
 
@@ -34,7 +38,7 @@ class Live2dModel:
 
     def set_model(self, model_name: str) -> None:
         """
-        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, and `self.emo_str` attributes.
+        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.model_info_json`, `self.emo_map`, and `self.emo_str` attributes.
         This method is called in the constructor.
 
         Parameters:
@@ -45,6 +49,7 @@ class Live2dModel:
         """
 
         self.model_info: dict = self._lookup_model_info(model_name)
+        self.model_info_json: str = dumps(self.model_info)
         self.emo_map: dict = {
             k.lower(): v for k, v in self.model_info["emotionMap"].items()
         }
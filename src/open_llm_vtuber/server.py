@@ -1,5 +1,7 @@
 import os
 import shutil
+import asyncio
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
@@ -27,9 +29,19 @@ class AvatarStaticFiles(StaticFiles):
         return await super().get_response(path, scope)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # On Python 3.12+ run new tasks eagerly, so the synchronous prefix of a
+    # conversation task starts right away instead of waiting a loop iteration.
+    # Older Pythons keep the default task factory.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    yield
+
+
 class WebSocketServer:
     def __init__(self, config: Config):
-        self.app = FastAPI()
+        self.app = FastAPI(lifespan=lifespan)
 
         # Add CORS
         self.app.add_middleware(
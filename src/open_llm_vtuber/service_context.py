@@ -17,6 +17,7 @@ from .tts.tts_factory import TTSFactory
 from .vad.vad_factory import VADFactory
 from .agent.agent_factory import AgentFactory
 from .translate.translate_factory import TranslateFactory
+from .utils.json_utils import dumps
 
 from .config_manager import (
     Config,
@@ -54,6 +55,10 @@ class ServiceContext:
 
         self.history_uid: str = ""  # Add history_uid field
 
+        # "set-model-and-conf" message without its closing brace, so a
+        # client_uid can be appended. Reset whenever the config is reloaded.
+        self._model_and_conf_prefix: str | None = None
+
     def __str__(self):
         return (
             f"ServiceContext:\n"
@@ -103,6 +108,7 @@ class ServiceContext:
         self.vad_engine = vad_engine
         self.agent_engine = agent_engine
         self.translate_engine = translate_engine
+        self._model_and_conf_prefix = None
 
         logger.debug(f"Loaded service context with cache: {character_config}")
 
@@ -151,6 +157,32 @@ class ServiceContext:
         self.config = config
         self.system_config = config.system_config or self.system_config
         self.character_config = config.character_config
+        self._model_and_conf_prefix = None
+
+    def model_and_conf_json(self, client_uid: str | None = None) -> str:
+        """
+        Get the "set-model-and-conf" message for the loaded model and config.
+
+        The model info is encoded once by the Live2D model, and the rest of
+        the message once per config, so sending it on every connection is a
+        string concatenation.
+
+        Parameters:
+        - client_uid (str, optional): The client uid to include in the message.
+
+        Returns:
+        - str: The JSON text of the message.
+        """
+        if self._model_and_conf_prefix is None:
+            self._model_and_conf_prefix = (
+                '{"type":"set-model-and-conf","model_info":'
+                f"{self.live2d_model.model_info_json}"
+                f',"conf_name":{dumps(self.character_config.conf_name)}'
+                f',"conf_uid":{dumps(self.character_config.conf_uid)}'
+            )
+        if client_uid is None:
+            return self._model_and_conf_prefix + "}"
+        return f'{self._model_and_conf_prefix},"client_uid":{dumps(client_uid)}}}'
 
     def init_live2d(self, live2d_model_name: str) -> None:
         logger.info(f"Initializing Live2D: {live2d_model_name}")
@@ -345,16 +377,7 @@ class ServiceContext:
                 )
 
                 # Send responses to client
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "set-model-and-conf",
-                            "model_info": self.live2d_model.model_info,
-                            "conf_name": self.character_config.conf_name,
-                            "conf_uid": self.character_config.conf_uid,
-                        }
-                    )
-                )
+                await websocket.send_text(self.model_and_conf_json())
 
                 await websocket.send_text(
                     json.dumps(
@@ -49,6 +49,30 @@ class TTSEngine(TTSInterface):
 
         return file_name
 
+    async def async_generate_audio_bytes(self, text):
+        """
+        Stream the speech audio from edge-tts straight into memory.
+        text: str
+            the text to speak
+
+        Returns:
+        bytes: the mp3 audio, or None if generation failed
+
+        """
+        try:
+            communicate = edge_tts.Communicate(text, self.voice)
+            audio_chunks = [
+                chunk["data"]
+                async for chunk in communicate.stream()
+                if chunk["type"] == "audio"
+            ]
+        except Exception as e:
+            logger.critical(f"\nError: edge-tts unable to generate audio: {e}")
+            logger.critical("It's possible that edge-tts is blocked in your region.")
+            return None
+
+        return b"".join(audio_chunks)
+
 
 # en-US-AvaMultilingualNeural
 # en-US-EmmaMultilingualNeural
@@ -1,6 +1,9 @@
 import abc
 import os
 import asyncio
+import secrets
+import time
+from typing import AsyncIterator
 
 from loguru import logger
 
@@ -24,6 +27,65 @@ class TTSInterface(metaclass=abc.ABCMeta):
         """
         return await asyncio.to_thread(self.generate_audio, text, file_name_no_ext)
 
+    async def async_generate_audio_bytes(self, text: str) -> bytes | None:
+        """
+        Asynchronously generate speech audio using TTS and return it in memory.
+
+        By default, this generates a cache file with async_generate_audio, reads
+        it back and removes it. Subclasses that receive the audio in memory can
+        override this method to skip the file system.
+
+        text: str
+            the text to speak
+
+        Returns:
+        bytes | None: the encoded audio in any format pydub can read, or None
+        if the engine failed to generate it
+
+        """
+        file_path = await self.async_generate_audio(
+            text=text,
+            file_name_no_ext=self._make_filename(),
+        )
+        if not file_path:
+            return None
+        try:
+            return await asyncio.to_thread(self._read_file, file_path)
+        finally:
+            self.remove_file(file_path)
+            logger.debug("Audio cache file cleaned.")
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Asynchronously generate speech audio using TTS, chunk by chunk.
+
+        Each chunk is sent to the frontend as its own audio payload as soon as
+        it is yielded, so every chunk must be a complete, playable audio file.
+        By default, this yields the whole audio of async_generate_audio_bytes
+        as a single chunk. Subclasses that synthesize incrementally can
+        override this method to lower the time to first audio.
+
+        text: str
+            the text to speak
+
+        Yields:
+        bytes: encoded audio chunks in any format pydub can read
+
+        """
+        audio_bytes = await self.async_generate_audio_bytes(text)
+        if audio_bytes:
+            yield audio_bytes
+
+    @staticmethod
+    def _make_filename() -> str:
+        """Unique cache file name without extension, from a ns timestamp"""
+        return f"{time.time_ns()}_{secrets.token_hex(4)}"
+
+    @staticmethod
+    def _read_file(filepath: str) -> bytes:
+        with open(filepath, "rb") as f:
+            return f.read()
+
     @abc.abstractmethod
     def generate_audio(self, text: str, file_name_no_ext=None) -> str:
         """
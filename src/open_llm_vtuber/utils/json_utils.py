@@ -0,0 +1,40 @@
+from typing import Any
+
+import orjson
+
+# Numpy arrays and scalars are encoded natively. Non-str dict keys are turned
+# into strings like the stdlib encoder does instead of raising.
+_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> str:
+    """
+    Encode obj as a JSON string for a websocket text frame.
+
+    Uses orjson, which is several times faster than the stdlib encoder on large
+    payloads such as base64 audio. Unlike the stdlib encoder, NaN and Infinity
+    are encoded as null, so the result is always valid JSON for the frontend.
+
+    Parameters:
+        obj (Any): The object to encode
+
+    Returns:
+        str: The JSON text
+    """
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS).decode()
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Decode a JSON text or binary websocket frame.
+
+    Uses orjson. Its JSONDecodeError subclasses the stdlib
+    json.JSONDecodeError, so callers can catch either one.
+
+    Parameters:
+        data (str | bytes): The JSON document
+
+    Returns:
+        Any: The decoded object
+    """
+    return orjson.loads(data)
@@ -1,4 +1,5 @@
 import base64
+import io
 from pydub import AudioSegment
 from pydub.utils import make_chunks
 from ..agent.output_types import Actions
@@ -30,16 +31,19 @@ def prepare_audio_payload(
     display_text: DisplayText = None,
     actions: Actions = None,
     forwarded: bool = False,
+    audio_bytes: bytes | None = None,
 ) -> dict[str, any]:
     """
     Prepares the audio payload for sending to a broadcast endpoint.
-    If audio_path is None, returns a payload with audio=None for silent display.
+    If both audio_path and audio_bytes are None, returns a payload with
+    audio=None for silent display.
 
     Parameters:
         audio_path (str | None): The path to the audio file to be processed, or None for silent display
         chunk_length_ms (int): The length of each audio chunk in milliseconds
         display_text (DisplayText, optional): Text to be displayed with the audio
         actions (Actions, optional): Actions associated with the audio
+        audio_bytes (bytes | None): Encoded audio held in memory, used instead of audio_path
 
     Returns:
         dict: The audio payload to be sent
@@ -47,7 +51,7 @@ def prepare_audio_payload(
     if isinstance(display_text, DisplayText):
         display_text = display_text.to_dict()
 
-    if not audio_path:
+    if not audio_path and not audio_bytes:
         # Return payload for silent display
         return {
             "type": "audio",
@@ -60,11 +64,13 @@ def prepare_audio_payload(
         }
 
     try:
-        audio = AudioSegment.from_file(audio_path)
+        audio = AudioSegment.from_file(
+            io.BytesIO(audio_bytes) if audio_bytes else audio_path
+        )
         audio_bytes = audio.export(format="wav").read()
     except Exception as e:
         raise ValueError(
-            f"Error loading or converting generated audio file to wav file '{audio_path}': {e}"
+            f"Error loading or converting generated audio to wav '{audio_path or 'in-memory audio'}': {e}"
         )
     audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
     volumes = _get_volume_by_chunks(audio, chunk_length_ms)
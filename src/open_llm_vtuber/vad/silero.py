@@ -1,15 +1,21 @@
 import asyncio
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
+from importlib import resources
 
 import numpy as np
-import torch
+import onnxruntime as ort
 from loguru import logger
 from pydantic import BaseModel
-from silero_vad import load_silero_vad
 
 from .vad_interface import VADInterface
 
+try:
+    import numba
+except ImportError:  # numba is optional, the state machine then runs in Python
+    numba = None
+
 
 class SileroVADConfig(BaseModel):
     orig_sr: int = 16000
@@ -21,6 +27,67 @@ class SileroVADConfig(BaseModel):
     smoothing_window: int = 5
 
 
+@lru_cache(maxsize=None)
+def _load_session(model_path: str) -> ort.InferenceSession:
+    """
+    Load the ONNX session once per model file. A session holds no state
+    between runs, so every engine shares it and keeps its own recurrent state.
+    """
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(
+        model_path, sess_options=opts, providers=["CPUExecutionProvider"]
+    )
+
+
+class SileroOnnxModel:
+    """
+    Silero VAD on ONNX Runtime, fed with numpy arrays only.
+
+    Keeps the recurrent state and the audio context between calls, like the
+    wrapper returned by silero_vad's load_silero_vad(onnx=True), but without
+    converting every window to and from torch tensors.
+    """
+
+    def __init__(self, model_path: str, sample_rate: int):
+        self.session = _load_session(model_path)
+        self.sample_rate = sample_rate
+        self.window_size = 512 if sample_rate == 16000 else 256
+        self.context_size = 64 if sample_rate == 16000 else 32
+
+        # Model input is the previous context followed by the new window,
+        # written in place for every call
+        self._input = np.zeros(
+            (1, self.context_size + self.window_size), dtype=np.float32
+        )
+        # The sample rate is constant, so the feed is built once and only its
+        # state entry changes between calls
+        self._feed = {
+            "input": self._input,
+            "state": np.zeros((2, 1, 128), dtype=np.float32),
+            "sr": np.array(sample_rate, dtype=np.int64),
+        }
+        # Views of the input buffer: where a window goes, the tail that
+        # becomes the next context, and where that context goes
+        self._window_view = self._input[0, self.context_size :]
+        self._tail_view = self._input[0, -self.context_size :]
+        self._context_view = self._input[0, : self.context_size]
+        self._run = self.session.run
+
+    def reset_states(self) -> None:
+        self._input.fill(0)
+        self._feed["state"] = np.zeros((2, 1, 128), dtype=np.float32)
+
+    def __call__(self, window: np.ndarray) -> float:
+        self._window_view[:] = window
+        out, self._feed["state"] = self._run(None, self._feed)
+        # The tail of this window is the context of the next one
+        self._context_view[:] = self._tail_view
+        return float(out[0, 0])
+
+
 class VADEngine(VADInterface):
     def __init__(
         self,
@@ -42,38 +109,73 @@ class VADEngine(VADInterface):
             smoothing_window=smoothing_window,
         )
         self.model = self.load_vad_model()
-        self.state = StateMachine(self.config)
-        self.window_size_samples = 512 if self.config.target_sr == 16000 else 256
+        self.window_size_samples = self.model.window_size
         # 512 / 16000 = 0.032s
+        self.state = StateMachine(self.config, self.window_size_samples)
+        # Samples after the last whole window, prepended to the next call
+        self._residual = np.empty(0, dtype=np.float32)
+        # The model and state machine carry state from call to call, so all
+        # async calls run in order on one worker thread
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="silero-vad"
+        )
 
-    def load_vad_model(self):
+    def load_vad_model(self) -> SileroOnnxModel:
         logger.info("Loading Silero-VAD model...")
-        return load_silero_vad()
+        # The ONNX model shipped with the silero-vad package
+        model_path = resources.files("silero_vad.data").joinpath("silero_vad.onnx")
+        return SileroOnnxModel(str(model_path), self.config.target_sr)
 
     def detect_speech(self, audio_data: list[float]):
         audio_np = np.array(audio_data, dtype=np.float32)
-        for i in range(0, len(audio_np), self.window_size_samples):
-            chunk_np = audio_np[i : i + self.window_size_samples]
-            if len(chunk_np) < self.window_size_samples:
-                break
-            chunk = torch.Tensor(chunk_np)
+        if len(self._residual):
+            audio_np = np.concatenate((self._residual, audio_np))
+        # Split into whole windows as zero-copy views; a trailing partial
+        # window is kept for the next call so no audio is lost
+        window_size = self.window_size_samples
+        num_windows = len(audio_np) // window_size
+        windows = audio_np[: num_windows * window_size].reshape(
+            num_windows, window_size
+        )
+        self._residual = audio_np[num_windows * window_size :].copy()
 
-            with torch.no_grad():
-                speech_prob = self.model(chunk, self.config.target_sr).item()
+        # Silero is recurrent, so windows are fed one after another to carry
+        # its state
+        speech_probs = np.fromiter(
+            map(self.model, windows), dtype=np.float32, count=num_windows
+        )
 
-            if speech_prob:
-                # print(speech_prob)
-                iter = self.state.get_result(speech_prob, chunk_np)
+        # Windows with a zero speech probability are skipped entirely
+        voiced = speech_probs != 0
+        voiced_windows = windows[voiced]
+        # dB on the int16 scale from the float32 power of each window, in one
+        # reduction without squared or float64 temporaries
+        power = np.einsum("ij,ij->i", voiced_windows, voiced_windows)
+        power *= np.float32(32767**2 / window_size)
+        dbs = 10 * np.log10(power + np.float32(1e-14))
+        smoothed_probs, smoothed_dbs = self.state.smooth(speech_probs[voiced], dbs)
+
+        # One int16 array for the whole call, sliced per window without copies
+        int_chunks = np.multiply(voiced_windows, 32767, dtype=np.float32)
+        iter = self.state.get_result(
+            smoothed_probs, smoothed_dbs, int_chunks.astype(np.int16)
+        )
 
-                for probs, dbs, chunk in iter:  # detected a sequence of voice bytes
-                    # rounded_probs = [round(x, 2) for x in probs]
-                    # rounded_dbs = [round(y, 2) for y in dbs]
+        for probs, dbs, chunk in iter:  # detected a sequence of voice bytes
+            # rounded_probs = [round(x, 2) for x in probs]
+            # rounded_dbs = [round(y, 2) for y in dbs]
 
-                    audio_chunk = bytes(chunk)
-                    yield audio_chunk
+            # Already bytes: the markers or one copy of the utterance
+            yield chunk
 
         del audio_np
 
+    async def async_detect_speech(self, audio_data: list[float]) -> list[bytes]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: list(self.detect_speech(audio_data))
+        )
+
 
 # Define state enumeration
 class State(Enum):
@@ -82,8 +184,85 @@ class State(Enum):
     INACTIVE = 3  # Speech end state (silence state)
 
 
+# What the state machine does with each window
+ACTION_PRE_BUFFER = 0  # idle, keep in the pre-buffer
+ACTION_START = 1  # speech started: pre-buffer, record and pause
+ACTION_RECORD = 2  # record into the utterance
+ACTION_END = 3  # speech ended: record, resume and emit the utterance
+
+
+def _run_state_machine(
+    probs,
+    dbs,
+    state,
+    hit_count,
+    miss_count,
+    prob_threshold,
+    db_threshold,
+    required_hits,
+    required_misses,
+):
+    """
+    Numeric core of StateMachine: threshold checks, hit/miss counters and
+    state transitions for a run of windows.
+
+    States are the int values of State. Returns the action of each window
+    and the state and counters to continue from.
+    """
+    actions = np.empty(len(probs), dtype=np.int8)
+    for i in range(len(probs)):
+        hit = probs[i] >= prob_threshold and dbs[i] >= db_threshold
+        if state == 1:  # IDLE
+            actions[i] = ACTION_PRE_BUFFER
+            if hit:
+                hit_count += 1
+                if hit_count >= required_hits:
+                    state = 2
+                    hit_count = 0
+                    actions[i] = ACTION_START
+            else:
+                hit_count = 0
+        elif state == 2:  # ACTIVE
+            actions[i] = ACTION_RECORD
+            if hit:
+                miss_count = 0
+            else:
+                miss_count += 1
+                if miss_count >= required_misses:
+                    state = 3
+                    miss_count = 0
+        else:  # INACTIVE
+            actions[i] = ACTION_RECORD
+            if hit:
+                hit_count += 1
+                if hit_count >= required_hits:
+                    state = 2
+                    hit_count = 0
+                    miss_count = 0
+            else:
+                hit_count = 0
+                miss_count += 1
+                if miss_count >= required_misses:
+                    state = 1
+                    miss_count = 0
+                    actions[i] = ACTION_END
+    return actions, state, hit_count, miss_count
+
+
+if numba is not None:
+    _run_state_machine = numba.njit(cache=True)(_run_state_machine)
+
+
+# Windows kept from before speech starts, prepended to the utterance
+PRE_BUFFER_WINDOWS = 20
+
+# Windows preallocated for an utterance, ~33 s at 32 ms per window. The
+# buffers double when a longer utterance fills them.
+INITIAL_UTTERANCE_WINDOWS = 1024
+
+
 class StateMachine:
-    def __init__(self, config: SileroVADConfig):
+    def __init__(self, config: SileroVADConfig, window_size: int = 512):
         self.state = State.IDLE
         self.prob_threshold = config.prob_threshold
         self.db_threshold = config.db_threshold
@@ -91,101 +270,158 @@ class StateMachine:
         self.required_misses = config.required_misses
         self.smoothing_window = config.smoothing_window
 
-        self.probs = []
-        self.dbs = []
-        self.bytes = bytearray()
+        # Utterance buffers, written in place up to self.num_windows
+        self.window_size = window_size
+        self.num_windows = 0
+        self.probs = np.empty(INITIAL_UTTERANCE_WINDOWS, dtype=np.float32)
+        self.dbs = np.empty(INITIAL_UTTERANCE_WINDOWS, dtype=np.float32)
+        self.audio = np.empty(INITIAL_UTTERANCE_WINDOWS * window_size, dtype=np.int16)
         self.miss_count = 0
         self.hit_count = 0
 
-        self.prob_window = deque(maxlen=self.smoothing_window)
-        self.db_window = deque(maxlen=self.smoothing_window)
-
-        self.pre_buffer = deque(maxlen=20)
-
-    @classmethod
-    def calculate_db(cls, audio_data: np.ndarray) -> float:
-        rms = np.sqrt(np.mean(np.square(audio_data)))
-        return 20 * np.log10(rms + 1e-7) if rms > 0 else -np.inf
+        # Last smoothing_window - 1 values, carried over to the next call
+        self.prob_history = np.empty(0)
+        self.db_history = np.empty(0)
+
+        # Ring of the last PRE_BUFFER_WINDOWS idle windows; pre_index is the
+        # next row to write and pre_count how many rows hold audio
+        self.pre_buffer = np.zeros((PRE_BUFFER_WINDOWS, window_size), dtype=np.int16)
+        self.pre_index = 0
+        self.pre_count = 0
+
+    def update(self, chunks: np.ndarray, probs: np.ndarray, dbs: np.ndarray):
+        """Append a run of int16 windows, one per row, to the utterance"""
+        n = self.num_windows
+        count = len(probs)
+        if n + count > len(self.probs):
+            self._grow_buffers(n + count)
+        self.probs[n : n + count] = probs
+        self.dbs[n : n + count] = dbs
+        start = n * self.window_size
+        self.audio[start : start + count * self.window_size] = chunks.ravel()
+        self.num_windows = n + count
+
+    def _pre_buffer_extend(self, chunks: np.ndarray):
+        # Only the last PRE_BUFFER_WINDOWS windows survive in the ring
+        chunks = chunks[-PRE_BUFFER_WINDOWS:]
+        rows = (self.pre_index + np.arange(len(chunks))) % PRE_BUFFER_WINDOWS
+        self.pre_buffer[rows] = chunks
+        self.pre_index = (self.pre_index + len(chunks)) % PRE_BUFFER_WINDOWS
+        self.pre_count = min(self.pre_count + len(chunks), PRE_BUFFER_WINDOWS)
+
+    def _pre_buffer_parts(self) -> tuple[np.ndarray, ...]:
+        # Oldest window first, as views into the ring
+        if self.pre_count < PRE_BUFFER_WINDOWS:
+            return (self.pre_buffer[: self.pre_count].ravel(),)
+        return (
+            self.pre_buffer[self.pre_index :].ravel(),
+            self.pre_buffer[: self.pre_index].ravel(),
+        )
 
-    def update(self, chunk_bytes, prob, db):
-        self.probs.append(prob)
-        self.dbs.append(db)
-        self.bytes.extend(chunk_bytes)
+    def _pre_buffer_clear(self):
+        self.pre_index = 0
+        self.pre_count = 0
+
+    def _grow_buffers(self, min_windows: int):
+        capacity = len(self.probs)
+        while capacity < min_windows:
+            capacity *= 2
+        n = self.num_windows
+        probs = np.empty(capacity, dtype=np.float32)
+        dbs = np.empty(capacity, dtype=np.float32)
+        audio = np.empty(capacity * self.window_size, dtype=np.int16)
+        probs[:n] = self.probs[:n]
+        dbs[:n] = self.dbs[:n]
+        audio[: n * self.window_size] = self.audio[: n * self.window_size]
+        self.probs, self.dbs, self.audio = probs, dbs, audio
 
     def reset_buffers(self):
-        self.probs.clear()
-        self.dbs.clear()
-        self.bytes.clear()
-
-    def get_smoothed_values(self, prob, db):
-        self.prob_window.append(prob)
-        self.db_window.append(db)
-        smoothed_prob = np.mean(self.prob_window)
-        smoothed_db = np.mean(self.db_window)
+        self.num_windows = 0
+
+    def smooth(
+        self, probs: np.ndarray, dbs: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Trailing mean over the last smoothing_window values of each window,
+        continuing from the values of previous calls.
+        """
+        smoothed_prob, self.prob_history = self._rolling_mean(self.prob_history, probs)
+        smoothed_db, self.db_history = self._rolling_mean(self.db_history, dbs)
         return smoothed_prob, smoothed_db
 
-    def process(self, prob, float_chunk_np: np.ndarray):
-        int_chunk_np = float_chunk_np * 32767
-        chunk_bytes = int_chunk_np.astype(np.int16).tobytes()
-        db = self.calculate_db(int_chunk_np)
-
-        # 获取平滑后的 prob 和 db
-        smoothed_prob, smoothed_db = self.get_smoothed_values(prob, db)
-
-        if self.state == State.IDLE:
-            self.pre_buffer.append(chunk_bytes)
-            if (
-                smoothed_prob >= self.prob_threshold
-                and smoothed_db >= self.db_threshold
-            ):
-                self.hit_count += 1
-                if self.hit_count >= self.required_hits:
-                    self.state = State.ACTIVE
-                    self.update(chunk_bytes, smoothed_prob, smoothed_db)
-                    self.hit_count = 0
-                    yield [], [], b"<|PAUSE|>"
-            else:
-                self.hit_count = 0
-
-        elif self.state == State.ACTIVE:
-            self.update(chunk_bytes, smoothed_prob, smoothed_db)
-            if (
-                smoothed_prob >= self.prob_threshold
-                and smoothed_db >= self.db_threshold
-            ):
-                self.miss_count = 0
-            else:
-                self.miss_count += 1
-                if self.miss_count >= self.required_misses:
-                    self.state = State.INACTIVE
-                    self.miss_count = 0
-
-        elif self.state == State.INACTIVE:
-            self.update(chunk_bytes, smoothed_prob, smoothed_db)
-            if (
-                smoothed_prob >= self.prob_threshold
-                and smoothed_db >= self.db_threshold
-            ):
-                self.hit_count += 1
-                if self.hit_count >= self.required_hits:
-                    self.state = State.ACTIVE
-                    self.hit_count = 0
-                    self.miss_count = 0
+    def _rolling_mean(
+        self, history: np.ndarray, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        window = self.smoothing_window
+        combined = np.concatenate((history, values))
+        cumsum = np.concatenate(([0.0], np.cumsum(combined)))
+        end = np.arange(len(history), len(combined)) + 1
+        start = np.maximum(end - window, 0)
+        means = (cumsum[end] - cumsum[start]) / (end - start)
+        keep = window - 1
+        return means, combined[len(combined) - keep :] if keep else combined[:0]
+
+    def process(self, smoothed_probs: np.ndarray, smoothed_dbs: np.ndarray, chunks):
+        """
+        Run the state machine over consecutive windows.
+
+        chunks holds the int16 audio of the windows, one per row. Runs of
+        windows with the same action are handled with one slice each.
+        """
+        actions, state, self.hit_count, self.miss_count = _run_state_machine(
+            smoothed_probs,
+            smoothed_dbs,
+            self.state.value,
+            self.hit_count,
+            self.miss_count,
+            self.prob_threshold,
+            self.db_threshold,
+            self.required_hits,
+            self.required_misses,
+        )
+        self.state = State(state)
+
+        # Start and end index of every run of equal actions
+        bounds = np.flatnonzero(np.diff(actions)) + 1
+        starts = [0, *bounds.tolist()]
+        ends = [*bounds.tolist(), len(actions)]
+        for start, end in zip(starts, ends):
+            if start == end:
+                continue
+            action = actions[start]
+            if action == ACTION_PRE_BUFFER:
+                self._pre_buffer_extend(chunks[start:end])
+            elif action == ACTION_RECORD:
+                self.update(
+                    chunks[start:end],
+                    smoothed_probs[start:end],
+                    smoothed_dbs[start:end],
+                )
             else:
-                self.hit_count = 0
-                self.miss_count += 1
-                if self.miss_count >= self.required_misses:
-                    self.state = State.IDLE
-                    self.miss_count = 0
-                    yield [], [], b"<|RESUME|>"
-                    if len(self.probs) > 30:
-                        pre_bytes = b"".join(self.pre_buffer)
-                        yield self.probs, self.dbs, pre_bytes + self.bytes
-                        self.reset_buffers()
-                    self.pre_buffer.clear()
-
-    def get_result(self, input_num, chunk_np):
-        yield from self.process(input_num, chunk_np)
+                # A state change never repeats on the next window, so START
+                # and END runs are a single window
+                window = chunks[start:end]
+                if action == ACTION_START:
+                    self._pre_buffer_extend(window)
+                self.update(window, smoothed_probs[start:end], smoothed_dbs[start:end])
+                if action == ACTION_START:
+                    yield [], [], b"<|PAUSE|>"
+                else:
+                    yield from self._end_utterance()
+
+    def _end_utterance(self):
+        yield [], [], b"<|RESUME|>"
+        n = self.num_windows
+        if n > 30:
+            audio = np.concatenate(
+                (*self._pre_buffer_parts(), self.audio[: n * self.window_size])
+            )
+            yield self.probs[:n].copy(), self.dbs[:n].copy(), audio.tobytes()
+            self.reset_buffers()
+        self._pre_buffer_clear()
+
+    def get_result(self, smoothed_probs, smoothed_dbs, chunks):
+        yield from self.process(smoothed_probs, smoothed_dbs, chunks)
 
 
 async def vad_main():
@@ -201,7 +437,7 @@ async def vad_main():
     async def audio_handler(websocket):
         async for chunk in tqdm(data_wrapper(websocket), desc="Audio chunk"):
             # print(len(chunk))
-            for _bytes in vad.detect_speech(chunk):
+            for _bytes in await vad.async_detect_speech(chunk):
                 print(_bytes[:44])
                 # await audio_queue.put(_bytes)
                 pass
@@ -224,4 +460,11 @@ async def vad_main():
 
 
 if __name__ == "__main__":
-    asyncio.run(vad_main())
+    # Same event loop as the server (see run_server.py): uvloop when it is
+    # installed, it is not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(vad_main())
+    else:
+        uvloop.run(vad_main())
@@ -5,15 +5,11 @@ from .vad_interface import VADInterface
 class VADFactory:
     @staticmethod
     def get_vad_engine(engine_type, **kwargs) -> Type[VADInterface]:
+        # Unset options fall back to the engine's own defaults
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
         if engine_type == "silero_vad":
             from .silero import VADEngine as SileroVADEngine
 
-            return SileroVADEngine(
-                kwargs.get("orig_sr"),
-                kwargs.get("target_sr"),
-                kwargs.get("prob_threshold"),
-                kwargs.get("db_threshold"),
-                kwargs.get("required_hits"),
-                kwargs.get("required_misses"),
-                kwargs.get("smoothing_window"),
-            )
+            return SileroVADEngine(**kwargs)
+        else:
+            raise ValueError(f"Unknown VAD engine type: {engine_type}")
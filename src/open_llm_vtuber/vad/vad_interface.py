@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -10,3 +11,17 @@ class VADInterface(ABC):
         :return: Returns a sequence of audio bytes containing human voice if voice activity is detected
         """
         pass
+
+    async def async_detect_speech(self, audio_data) -> list[bytes]:
+        """
+        Asynchronously detect voice activity in the audio data.
+
+        By default, this runs the synchronous detect_speech in a thread and
+        collects its results, so inference does not block the event loop.
+        Engines with state shared between calls should override this method
+        to serialize calls, e.g. on a dedicated single-thread executor.
+
+        :param audio_data: Input audio data
+        :return: The audio bytes and markers detect_speech yields
+        """
+        return await asyncio.to_thread(lambda: list(self.detect_speech(audio_data)))
@@ -1,8 +1,9 @@
-from typing import Dict, List, Optional, Callable, TypedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Callable, TypedDict
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
+import base64
 import json
-from enum import Enum
 import numpy as np
 from loguru import logger
 
@@ -15,6 +16,7 @@ from .chat_group import (
 )
 from .message_handler import message_handler
 from .utils.stream_audio import prepare_audio_payload
+from .utils.json_utils import dumps, loads
 from .chat_history_manager import (
     create_new_history,
     get_history,
@@ -26,23 +28,17 @@ from .conversations.conversation_handler import (
     handle_conversation_trigger,
     handle_group_interrupt,
     handle_individual_interrupt,
+    release_tts_manager,
 )
+from .conversations.types import AudioBuffer
 
-
-class MessageType(Enum):
-    """Enum for WebSocket message types"""
-
-    GROUP = ["add-client-to-group", "remove-client-from-group"]
-    HISTORY = [
-        "fetch-history-list",
-        "fetch-and-set-history",
-        "create-new-history",
-        "delete-history",
-    ]
-    CONVERSATION = ["mic-audio-end", "text-input", "ai-speak-signal"]
-    CONFIG = ["fetch-configs", "switch-config"]
-    CONTROL = ["interrupt-signal", "audio-play-start"]
-    DATA = ["mic-audio-data"]
+# Static messages, encoded once
+CONNECTION_ESTABLISHED_JSON = dumps(
+    {"type": "full-text", "text": "Connection established"}
+)
+START_MIC_JSON = dumps({"type": "control", "text": "start-mic"})
+INTERRUPT_JSON = dumps({"type": "control", "text": "interrupt"})
+MIC_AUDIO_END_JSON = dumps({"type": "control", "text": "mic-audio-end"})
 
 
 class WSMessage(TypedDict, total=False):
@@ -51,7 +47,8 @@ class WSMessage(TypedDict, total=False):
     type: str
     action: Optional[str]
     text: Optional[str]
-    audio: Optional[List[float]]
+    # Float samples, or base64 little-endian int16 PCM for mic-audio-data-v2
+    audio: Optional[List[float] | str]
     images: Optional[List[str]]
     history_uid: Optional[str]
     file: Optional[str]
@@ -68,32 +65,36 @@ class WebSocketHandler:
         self.chat_group_manager = ChatGroupManager()
         self.current_conversation_tasks: Dict[str, Optional[asyncio.Task]] = {}
         self.default_context_cache = default_context_cache
-        self.received_data_buffers: Dict[str, np.ndarray] = {}
+        self.received_data_buffers: Dict[str, AudioBuffer] = {}
 
         # Message handlers mapping
         self._message_handlers = self._init_message_handlers()
 
-    def _init_message_handlers(self) -> Dict[str, Callable]:
+    def _init_message_handlers(self) -> Mapping[str, Callable]:
         """Initialize message type to handler mapping"""
-        return {
-            "add-client-to-group": self._handle_group_operation,
-            "remove-client-from-group": self._handle_group_operation,
-            "request-group-info": self._handle_group_info,
-            "fetch-history-list": self._handle_history_list_request,
-            "fetch-and-set-history": self._handle_fetch_history,
-            "create-new-history": self._handle_create_history,
-            "delete-history": self._handle_delete_history,
-            "interrupt-signal": self._handle_interrupt,
-            "mic-audio-data": self._handle_audio_data,
-            "mic-audio-end": self._handle_conversation_trigger,
-            "raw-audio-data": self._handle_raw_audio_data,
-            "text-input": self._handle_conversation_trigger,
-            "ai-speak-signal": self._handle_conversation_trigger,
-            "fetch-configs": self._handle_fetch_configs,
-            "switch-config": self._handle_config_switch,
-            "fetch-backgrounds": self._handle_fetch_backgrounds,
-            "audio-play-start": self._handle_audio_play_start,
-        }
+        return MappingProxyType(
+            {
+                "add-client-to-group": self._handle_group_operation,
+                "remove-client-from-group": self._handle_group_operation,
+                "request-group-info": self._handle_group_info,
+                "fetch-history-list": self._handle_history_list_request,
+                "fetch-and-set-history": self._handle_fetch_history,
+                "create-new-history": self._handle_create_history,
+                "delete-history": self._handle_delete_history,
+                "interrupt-signal": self._handle_interrupt,
+                "mic-audio-data": self._handle_audio_data,
+                "mic-audio-data-v2": self._handle_audio_data_v2,
+                "mic-audio-end": self._handle_conversation_trigger,
+                "raw-audio-data": self._handle_raw_audio_data,
+                "text-input": self._handle_conversation_trigger,
+                "ai-speak-signal": self._handle_conversation_trigger,
+                "fetch-configs": self._handle_fetch_configs,
+                "switch-config": self._handle_config_switch,
+                "fetch-backgrounds": self._handle_fetch_backgrounds,
+                "audio-play-start": self._handle_audio_play_start,
+                "frontend-playback-complete": self._handle_playback_complete,
+            }
+        )
 
     async def handle_new_connection(
         self, websocket: WebSocket, client_uid: str
@@ -137,9 +138,9 @@ class WebSocketHandler:
         """Store client data and initialize group status"""
         self.client_connections[client_uid] = websocket
         self.client_contexts[client_uid] = session_service_context
-        self.received_data_buffers[client_uid] = np.array([])
+        self.received_data_buffers[client_uid] = AudioBuffer()
 
-        self.chat_group_manager.client_group_map[client_uid] = ""
+        self.chat_group_manager.register_client(client_uid)
         await self.send_group_update(websocket, client_uid)
 
     async def _send_initial_messages(
@@ -149,27 +150,17 @@ class WebSocketHandler:
         session_service_context: ServiceContext,
     ):
         """Send initial connection messages to the client"""
-        await websocket.send_text(
-            json.dumps({"type": "full-text", "text": "Connection established"})
-        )
+        await websocket.send_text(CONNECTION_ESTABLISHED_JSON)
 
         await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "set-model-and-conf",
-                    "model_info": session_service_context.live2d_model.model_info,
-                    "conf_name": session_service_context.character_config.conf_name,
-                    "conf_uid": session_service_context.character_config.conf_uid,
-                    "client_uid": client_uid,
-                }
-            )
+            session_service_context.model_and_conf_json(client_uid)
         )
 
         # Send initial group status
         await self.send_group_update(websocket, client_uid)
 
         # Start microphone
-        await websocket.send_text(json.dumps({"type": "control", "text": "start-mic"}))
+        await websocket.send_text(START_MIC_JSON)
 
     async def _init_service_context(self) -> ServiceContext:
         """Initialize service context for a new session by cloning the default context"""
@@ -201,12 +192,22 @@ class WebSocketHandler:
             websocket: The WebSocket connection
             client_uid: Unique identifier for the client
         """
+        # The context object lives as long as the connection (config switches
+        # update it in place), so it is looked up once rather than per message
+        context = self.client_contexts[client_uid]
         try:
             while True:
                 try:
-                    data = await websocket.receive_json()
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(message.get("code", 1000))
+                    if message.get("bytes") is not None:
+                        # Binary frames carry raw mic audio, skipping JSON
+                        self._append_pcm16(client_uid, message["bytes"])
+                        continue
+                    data = loads(message["text"])
                     message_handler.handle_message(client_uid, data)
-                    await self._route_message(websocket, client_uid, data)
+                    await self._route_message(websocket, client_uid, data, context)
                 except WebSocketDisconnect:
                     raise
                 except json.JSONDecodeError:
@@ -215,7 +216,7 @@ class WebSocketHandler:
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
                     await websocket.send_text(
-                        json.dumps({"type": "error", "message": str(e)})
+                        dumps({"type": "error", "message": str(e)})
                     )
                     continue
 
@@ -227,7 +228,11 @@ class WebSocketHandler:
             raise
 
     async def _route_message(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """
         Route incoming message to appropriate handler
@@ -236,6 +241,7 @@ class WebSocketHandler:
             websocket: The WebSocket connection
             client_uid: Client identifier
             data: Message data
+            context: The client's service context
         """
         msg_type = data.get("type")
         if not msg_type:
@@ -244,13 +250,16 @@ class WebSocketHandler:
 
         handler = self._message_handlers.get(msg_type)
         if handler:
-            await handler(websocket, client_uid, data)
+            await handler(websocket, client_uid, data, context)
         else:
-            if msg_type != "frontend-playback-complete":
-                logger.warning(f"Unknown message type: {msg_type}")
+            logger.warning(f"Unknown message type: {msg_type}")
 
     async def _handle_group_operation(
-        self, websocket: WebSocket, client_uid: str, data: dict
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: dict,
+        context: ServiceContext,
     ) -> None:
         """Handle group-related operations"""
         operation = data.get("type")
@@ -299,9 +308,10 @@ class WebSocketHandler:
 
         logger.info(f"Client {client_uid} disconnected")
         message_handler.cleanup_client(client_uid)
+        release_tts_manager(client_uid)
 
     async def broadcast_to_group(
-        self, group_members: list[str], message: dict, exclude_uid: str = None
+        self, group_members: list[str], message: dict | str, exclude_uid: str = None
     ) -> None:
         """Broadcasts a message to group members"""
         await broadcast_to_group(
@@ -317,7 +327,7 @@ class WebSocketHandler:
         if group:
             current_members = self.chat_group_manager.get_group_members(client_uid)
             await websocket.send_text(
-                json.dumps(
+                dumps(
                     {
                         "type": "group-update",
                         "members": current_members,
@@ -327,7 +337,7 @@ class WebSocketHandler:
             )
         else:
             await websocket.send_text(
-                json.dumps(
+                dumps(
                     {
                         "type": "group-update",
                         "members": [],
@@ -337,11 +347,14 @@ class WebSocketHandler:
             )
 
     async def _handle_interrupt(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle conversation interruption"""
         heard_response = data.get("text", "")
-        context = self.client_contexts[client_uid]
         group = self.chat_group_manager.get_client_group(client_uid)
 
         if group and len(group.members) > 1:
@@ -362,24 +375,30 @@ class WebSocketHandler:
             )
 
     async def _handle_history_list_request(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle request for chat history list"""
-        context = self.client_contexts[client_uid]
         histories = get_history_list(context.character_config.conf_uid)
         await websocket.send_text(
-            json.dumps({"type": "history-list", "histories": histories})
+            dumps({"type": "history-list", "histories": histories})
         )
 
     async def _handle_fetch_history(
-        self, websocket: WebSocket, client_uid: str, data: dict
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: dict,
+        context: ServiceContext,
     ):
         """Handle fetching and setting specific chat history"""
         history_uid = data.get("history_uid")
         if not history_uid:
             return
 
-        context = self.client_contexts[client_uid]
         # Update history_uid in service context
         context.history_uid = history_uid
         context.agent_engine.set_memory_from_history(
@@ -395,15 +414,16 @@ class WebSocketHandler:
             )
             if msg["role"] != "system"
         ]
-        await websocket.send_text(
-            json.dumps({"type": "history-data", "messages": messages})
-        )
+        await websocket.send_text(dumps({"type": "history-data", "messages": messages}))
 
     async def _handle_create_history(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle creation of new chat history"""
-        context = self.client_contexts[client_uid]
         history_uid = create_new_history(context.character_config.conf_uid)
         if history_uid:
             context.history_uid = history_uid
@@ -412,7 +432,7 @@ class WebSocketHandler:
                 history_uid=history_uid,
             )
             await websocket.send_text(
-                json.dumps(
+                dumps(
                     {
                         "type": "new-history-created",
                         "history_uid": history_uid,
@@ -421,20 +441,23 @@ class WebSocketHandler:
             )
 
     async def _handle_delete_history(
-        self, websocket: WebSocket, client_uid: str, data: dict
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: dict,
+        context: ServiceContext,
     ):
         """Handle deletion of chat history"""
         history_uid = data.get("history_uid")
         if not history_uid:
             return
 
-        context = self.client_contexts[client_uid]
         success = delete_history(
             context.character_config.conf_uid,
             history_uid,
         )
         await websocket.send_text(
-            json.dumps(
+            dumps(
                 {
                     "type": "history-deleted",
                     "success": success,
@@ -446,49 +469,73 @@ class WebSocketHandler:
             context.history_uid = None
 
     async def _handle_audio_data(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle incoming audio data"""
         audio_data = data.get("audio", [])
         if audio_data:
-            self.received_data_buffers[client_uid] = np.append(
-                self.received_data_buffers[client_uid],
-                np.array(audio_data, dtype=np.float32),
+            self.received_data_buffers[client_uid].append(
+                np.array(audio_data, dtype=np.float32)
+            )
+
+    async def _handle_audio_data_v2(
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
+    ) -> None:
+        """Handle incoming audio data sent as base64 int16 PCM"""
+        audio_data = data.get("audio")
+        if audio_data:
+            self._append_pcm16(client_uid, base64.b64decode(audio_data))
+
+    def _append_pcm16(self, client_uid: str, pcm: bytes) -> None:
+        """Buffer little-endian int16 PCM, converted to float32 when taken"""
+        if pcm:
+            self.received_data_buffers[client_uid].append(
+                np.frombuffer(pcm, dtype="<i2")
             )
 
     async def _handle_raw_audio_data(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle incoming raw audio data for VAD processing"""
-        context = self.client_contexts[client_uid]
         chunk = data.get("audio", [])
         if chunk:
-            for audio_bytes in context.vad_engine.detect_speech(chunk):
+            for audio_bytes in await context.vad_engine.async_detect_speech(chunk):
                 if audio_bytes == b"<|PAUSE|>":
-                    await websocket.send_text(
-                        json.dumps({"type": "control", "text": "interrupt"})
-                    )
+                    await websocket.send_text(INTERRUPT_JSON)
                 elif audio_bytes == b"<|RESUME|>":
                     pass
                 elif len(audio_bytes) > 1024:
                     # Detected audio activity (voice)
-                    self.received_data_buffers[client_uid] = np.append(
-                        self.received_data_buffers[client_uid],
-                        np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32),
-                    )
-                    await websocket.send_text(
-                        json.dumps({"type": "control", "text": "mic-audio-end"})
+                    self.received_data_buffers[client_uid].append(
+                        np.frombuffer(audio_bytes, dtype=np.int16)
                     )
+                    await websocket.send_text(MIC_AUDIO_END_JSON)
 
     async def _handle_conversation_trigger(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle triggers that start a conversation"""
         await handle_conversation_trigger(
             msg_type=data.get("type", ""),
             data=data,
             client_uid=client_uid,
-            context=self.client_contexts[client_uid],
+            context=context,
             websocket=websocket,
             client_contexts=self.client_contexts,
             client_connections=self.client_connections,
@@ -499,35 +546,49 @@ class WebSocketHandler:
         )
 
     async def _handle_fetch_configs(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle fetching available configurations"""
-        context = self.client_contexts[client_uid]
         config_files = scan_config_alts_directory(context.system_config.config_alts_dir)
         await websocket.send_text(
-            json.dumps({"type": "config-files", "configs": config_files})
+            dumps({"type": "config-files", "configs": config_files})
         )
 
     async def _handle_config_switch(
-        self, websocket: WebSocket, client_uid: str, data: dict
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: dict,
+        context: ServiceContext,
     ):
         """Handle switching to a different configuration"""
         config_file_name = data.get("file")
         if config_file_name:
-            context = self.client_contexts[client_uid]
             await context.handle_config_switch(websocket, config_file_name)
 
     async def _handle_fetch_backgrounds(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle fetching available background images"""
         bg_files = scan_bg_directory()
         await websocket.send_text(
-            json.dumps({"type": "background-files", "files": bg_files})
+            dumps({"type": "background-files", "files": bg_files})
         )
 
     async def _handle_audio_play_start(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """
         Handle audio playback start notification
@@ -546,8 +607,24 @@ class WebSocketHandler:
                     group_members, silent_payload, exclude_uid=client_uid
                 )
 
+    async def _handle_playback_complete(
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
+    ) -> None:
+        """
+        Nothing to do: playback completion is delivered to the waiting
+        conversation by message_handler.handle_message before routing
+        """
+
     async def _handle_group_info(
-        self, websocket: WebSocket, client_uid: str, data: WSMessage
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        data: WSMessage,
+        context: ServiceContext,
     ) -> None:
         """Handle group info request"""
         await self.send_group_update(websocket, client_uid)
@@ -8,6 +8,7 @@ import platform
 import subprocess
 import time
 from datetime import datetime
+from functools import lru_cache
 from merge_configs import merge_configs, compare_configs
 
 USER_CONF = "conf.yaml"
@@ -170,9 +171,19 @@ Continue? (y/N): """,
 }
 
 
+@lru_cache(maxsize=1)
 def get_system_language():
     """Get system language using a combination of methods."""
 
+    # Check the locale environment variables first, they are free to read
+    env_lang = (
+        os.environ.get("LC_ALL")
+        or os.environ.get("LC_MESSAGES")
+        or os.environ.get("LANG")
+    )
+    if env_lang and env_lang.split("_")[0].startswith("zh"):
+        return "zh"
+
     os_name = platform.system()
 
     if os_name == "Windows":
@@ -188,7 +199,7 @@ def get_system_language():
         except Exception:
             pass
 
-    elif os_name == "Darwin":  # macOS
+    elif os_name == "Darwin" and not env_lang:  # macOS
         try:
             # Use defaults command to get the AppleLocale
             result = subprocess.run(
@@ -202,14 +213,6 @@ def get_system_language():
         except Exception:
             pass
 
-    elif os_name == "Linux":
-        # Check the LANG environment variable
-        lang = os.environ.get("LANG")
-        if lang:
-            lang = lang.split("_")[0]
-            if lang.startswith("zh"):
-                return "zh"
-
     # Fallback to using locale.getpreferredencoding()
     encoding = locale.getpreferredencoding()
     if encoding.lower() in ("cp936", "gbk", "big5"):